@@ -1,7 +1,10 @@
+import os
 from logging.config import fileConfig
 
+from dotenv import load_dotenv
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.engine import make_url
 
 from alembic import context
 
@@ -14,6 +17,19 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# Migrate the same database the app uses. Alembic runs synchronously, so the
+# URL is given the psycopg2 driver, which accepts libpq query parameters as-is
+load_dotenv()
+database_url = os.getenv("DATABASE_URL")
+if database_url:
+    url = make_url(database_url)
+    if url.get_backend_name() in ("postgres", "postgresql"):
+        url = url.set(drivername="postgresql+psycopg2")
+    # "%" is the ini interpolation character
+    config.set_main_option(
+        "sqlalchemy.url", url.render_as_string(hide_password=False).replace("%", "%%")
+    )
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
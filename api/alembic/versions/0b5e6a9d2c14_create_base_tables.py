@@ -0,0 +1,69 @@
+"""create base tables
+
+Revision ID: 0b5e6a9d2c14
+Revises:
+Create Date: 2026-10-15 23:20:11.305127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b5e6a9d2c14'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases that predate migrations got these tables from create_all at
+    # startup; only a fresh database needs them created here
+    if sa.inspect(op.get_bind()).has_table('cluster_lists'):
+        return
+
+    op.create_table('cluster_lists',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('list_id', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cluster_lists_list_id'), 'cluster_lists', ['list_id'], unique=True)
+    op.create_index(op.f('ix_cluster_lists_title'), 'cluster_lists', ['title'], unique=False)
+    op.create_table('clusters',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('cluster_list_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['cluster_list_id'], ['cluster_lists.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_clusters_title'), 'clusters', ['title'], unique=False)
+    op.create_table('qa_pairs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('qa_id', sa.String(), nullable=False),
+    sa.Column('question', sa.String(), nullable=False),
+    sa.Column('answer', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('cluster_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['cluster_id'], ['clusters.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_qa_pairs_qa_id'), 'qa_pairs', ['qa_id'], unique=True)
+    op.create_index(op.f('ix_qa_pairs_question'), 'qa_pairs', ['question'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_qa_pairs_question'), table_name='qa_pairs')
+    op.drop_index(op.f('ix_qa_pairs_qa_id'), table_name='qa_pairs')
+    op.drop_table('qa_pairs')
+    op.drop_index(op.f('ix_clusters_title'), table_name='clusters')
+    op.drop_table('clusters')
+    op.drop_index(op.f('ix_cluster_lists_title'), table_name='cluster_lists')
+    op.drop_index(op.f('ix_cluster_lists_list_id'), table_name='cluster_lists')
+    op.drop_table('cluster_lists')
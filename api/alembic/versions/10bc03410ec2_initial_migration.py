@@ -1,7 +1,7 @@
 """initial migration
 
 Revision ID: 10bc03410ec2
-Revises: 
+Revises: 0b5e6a9d2c14
 Create Date: 2025-09-26 16:56:42.261811
 
 """
@@ -14,7 +14,7 @@ import sqlmodel
 
 # revision identifiers, used by Alembic.
 revision: str = '10bc03410ec2'
-down_revision: Union[str, Sequence[str], None] = None
+down_revision: Union[str, Sequence[str], None] = '0b5e6a9d2c14'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
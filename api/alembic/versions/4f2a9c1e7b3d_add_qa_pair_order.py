@@ -0,0 +1,36 @@
+"""add qa pair order
+
+Revision ID: 4f2a9c1e7b3d
+Revises: 10bc03410ec2
+Create Date: 2026-10-15 09:12:31.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2a9c1e7b3d'
+down_revision: Union[str, Sequence[str], None] = '10bc03410ec2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('qa_pairs', sa.Column('order', sa.Integer(), nullable=False, server_default='0'))
+    # Number existing Q&As per cluster in insertion (id) order, so they keep
+    # their current position instead of all sharing order 0
+    op.execute(
+        'UPDATE qa_pairs SET "order" = numbered.position '
+        'FROM (SELECT id, row_number() OVER (PARTITION BY cluster_id ORDER BY id) - 1 AS position '
+        'FROM qa_pairs) AS numbered '
+        'WHERE qa_pairs.id = numbered.id'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('qa_pairs', 'order')
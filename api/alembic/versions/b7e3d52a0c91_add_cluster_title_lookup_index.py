@@ -0,0 +1,28 @@
+"""add cluster title lookup index
+
+Revision ID: b7e3d52a0c91
+Revises: 4f2a9c1e7b3d
+Create Date: 2026-10-15 10:04:18.227604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d52a0c91'
+down_revision: Union[str, Sequence[str], None] = '4f2a9c1e7b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_clusters_list_id_lower_title', 'clusters', ['cluster_list_id', sa.text('lower(title)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_clusters_list_id_lower_title', table_name='clusters')
@@ -0,0 +1,38 @@
+"""cascade cluster foreign keys
+
+Revision ID: c41d8e6f2a57
+Revises: b7e3d52a0c91
+Create Date: 2026-10-15 11:12:40.518362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d8e6f2a57'
+down_revision: Union[str, Sequence[str], None] = 'b7e3d52a0c91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('clusters_cluster_list_id_fkey', 'clusters', type_='foreignkey')
+    op.create_foreign_key('clusters_cluster_list_id_fkey', 'clusters', 'cluster_lists', ['cluster_list_id'], ['id'], ondelete='CASCADE')
+    op.drop_constraint('qa_pairs_cluster_id_fkey', 'qa_pairs', type_='foreignkey')
+    op.create_foreign_key('qa_pairs_cluster_id_fkey', 'qa_pairs', 'clusters', ['cluster_id'], ['id'], ondelete='CASCADE')
+    op.drop_constraint('source_notes_cluster_id_fkey', 'source_notes', type_='foreignkey')
+    op.create_foreign_key('source_notes_cluster_id_fkey', 'source_notes', 'clusters', ['cluster_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('source_notes_cluster_id_fkey', 'source_notes', type_='foreignkey')
+    op.create_foreign_key('source_notes_cluster_id_fkey', 'source_notes', 'clusters', ['cluster_id'], ['id'])
+    op.drop_constraint('qa_pairs_cluster_id_fkey', 'qa_pairs', type_='foreignkey')
+    op.create_foreign_key('qa_pairs_cluster_id_fkey', 'qa_pairs', 'clusters', ['cluster_id'], ['id'])
+    op.drop_constraint('clusters_cluster_list_id_fkey', 'clusters', type_='foreignkey')
+    op.create_foreign_key('clusters_cluster_list_id_fkey', 'clusters', 'cluster_lists', ['cluster_list_id'], ['id'])
@@ -0,0 +1,28 @@
+"""add qa cluster order index
+
+Revision ID: d5a7f13b9e02
+Revises: c41d8e6f2a57
+Create Date: 2026-10-15 11:41:07.093815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a7f13b9e02'
+down_revision: Union[str, Sequence[str], None] = 'c41d8e6f2a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_qa_cluster_order', 'qa_pairs', ['cluster_id', 'order'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_qa_cluster_order', table_name='qa_pairs')
@@ -1,4 +1,5 @@
+from .config import AUTOCREATE_TABLES
 from .connection import engine, get_session, create_db_and_tables
 from .service import DatabaseService
 
-__all__ = ["engine", "get_session", "create_db_and_tables", "DatabaseService"]
+__all__ = ["AUTOCREATE_TABLES", "engine", "get_session", "create_db_and_tables", "DatabaseService"]
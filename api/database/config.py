@@ -1,5 +1,9 @@
+import logging
 import os
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
@@ -10,11 +14,41 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable not set")
 
+# Query parameters that asyncpg.connect() accepts. Hosted Postgres URLs are
+# written for libpq and may carry others (channel_binding, connect_timeout, ...),
+# which asyncpg rejects with a TypeError on the first connection
+ASYNCPG_QUERY_PARAMETERS = {"host", "port", "ssl", "target_session_attrs", "prepared_statement_cache_size"}
+
+# The engine is async, so Postgres URLs must use the asyncpg driver
+DATABASE_URL = make_url(DATABASE_URL)
+if DATABASE_URL.get_backend_name() in ("postgres", "postgresql"):
+    query = dict(DATABASE_URL.query)
+    # asyncpg spells libpq's sslmode as ssl and accepts the same values
+    if "sslmode" in query:
+        query.setdefault("ssl", query.pop("sslmode"))
+    unsupported = sorted(set(query) - ASYNCPG_QUERY_PARAMETERS)
+    if unsupported:
+        logger.warning("Ignoring DATABASE_URL parameters asyncpg does not support: %s", ", ".join(unsupported))
+    DATABASE_URL = DATABASE_URL.set(
+        drivername="postgresql+asyncpg",
+        query={key: value for key, value in query.items() if key in ASYNCPG_QUERY_PARAMETERS},
+    )
+
+# Schema is managed by Alembic (`alembic upgrade head`, which also creates the
+# tables on a fresh database); set AUTOCREATE_TABLES=1 to create them at startup instead
+AUTOCREATE_TABLES = os.getenv("AUTOCREATE_TABLES", "0") == "1"
+
 # SQLAlchemy engine configuration
 ENGINE_CONFIG = {
-    "echo": True,  # Set to False in production
-    "pool_size": 10,
-    "max_overflow": 20,
+    # SQL logging stringifies every statement; opt in with SQL_ECHO=1 for debugging
+    "echo": os.getenv("SQL_ECHO", "0") == "1",
+    "echo_pool": False,
+    # Connection pool sizing, tunable per deployment
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("DB_POOL_OVERFLOW", "40")),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+    # pre_ping costs one round-trip per checkout but avoids handing out connections
+    # the provider has dropped; a longer recycle keeps reconnect churn low
     "pool_pre_ping": True,
-    "pool_recycle": 300
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
 }
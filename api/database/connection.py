@@ -1,17 +1,28 @@
-from sqlmodel import SQLModel, create_engine, Session
-from typing import Generator
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from typing import AsyncGenerator
 from .config import DATABASE_URL, ENGINE_CONFIG
 
 # Create engine
-engine = create_engine(DATABASE_URL, **ENGINE_CONFIG)
+engine = create_async_engine(DATABASE_URL, **ENGINE_CONFIG)
 
+# Session factory; objects stay usable after commit without re-SELECTing them
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-def create_db_and_tables():
+
+async def create_db_and_tables():
     """Create database tables"""
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Get database session"""
-    with Session(engine) as session:
-        yield session
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get database session, committing once if the request succeeds"""
+    async with async_session() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -1,174 +1,385 @@
-from sqlmodel import Session, select
-from typing import List, Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import String, Text, bindparam, case, cast, delete, func, insert, lambda_stmt, literal_column, null, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import selectinload
+from typing import List, Optional, Tuple
+from datetime import datetime
+import logging
+import time
+from uuid import uuid4
 from models.database_models import ClusterListDB, ClusterDB, QAPairDB, SourceNoteDB
 from models.api_models import ClusterList, Cluster, QAPair, ClusterListInfo, SourceNote, SourceMetadata, SourceContent
 
+logger = logging.getLogger(__name__)
+
+
+# Load a cluster list's clusters and their cards in bulk (one SELECT per level)
+# instead of lazily per cluster when converting to the API model
+CLUSTER_LIST_EAGER_OPTIONS = (
+    selectinload(ClusterListDB.clusters).selectinload(ClusterDB.qas),
+    selectinload(ClusterListDB.clusters).selectinload(ClusterDB.source_notes),
+)
+
+
+# Hot lookups built once as lambda statements; each call only supplies new
+# bound parameters, so statement construction and compilation are cached
+_GET_CLUSTER_LIST_BY_LIST_ID = lambda_stmt(
+    lambda: select(ClusterListDB).where(ClusterListDB.list_id == bindparam("list_id"))
+)
+_GET_CLUSTER_LIST_BY_LIST_ID_EAGER = lambda_stmt(
+    lambda: select(ClusterListDB)
+    .where(ClusterListDB.list_id == bindparam("list_id"))
+    .options(*CLUSTER_LIST_EAGER_OPTIONS)
+)
+_GET_CLUSTER_BY_TITLE = lambda_stmt(
+    lambda: select(ClusterDB)
+    .join(ClusterListDB, ClusterDB.cluster_list_id == ClusterListDB.id)
+    .where(
+        ClusterListDB.list_id == bindparam("list_id"),
+        # Equality on lower(title) can use ix_clusters_list_id_lower_title, unlike ILIKE.
+        # Case folding matches ILIKE for ASCII titles; other scripts follow the DB collation.
+        func.lower(ClusterDB.title) == bindparam("title")
+    )
+)
+_GET_QA_PAIR_BY_QA_ID = lambda_stmt(
+    lambda: select(QAPairDB).where(QAPairDB.qa_id == bindparam("qa_id"))
+)
+_LOCK_CLUSTER = lambda_stmt(
+    lambda: select(ClusterDB.id).where(ClusterDB.id == bindparam("cluster_id")).with_for_update()
+)
+_GET_SOURCE_NOTE_BY_SOURCE_NOTE_ID = lambda_stmt(
+    lambda: select(SourceNoteDB).where(SourceNoteDB.source_note_id == bindparam("source_note_id"))
+)
+
+
+def _iso_utc(column):
+    """SQL rendering of a naive UTC timestamp in the API's ISO-8601 "...Z" format"""
+    # .US always prints six digits, as isoformat(timespec="microseconds") does in Python
+    return func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS.US', type_=String) + "Z"
+
+
+def _json_array_agg(value, empty, *order_by):
+    """jsonb_agg(value ORDER BY order_by), or an empty array when there are no rows"""
+    return func.coalesce(func.jsonb_agg(aggregate_order_by(value, *order_by)), literal_column(empty))
+
+
+def _build_cluster_list_json_statement():
+    """Build the ClusterList API document (clusters, Q&As and source notes) in one query"""
+    qa_json = func.jsonb_build_object(
+        "_id", QAPairDB.qa_id,
+        "question", QAPairDB.question,
+        "answer", QAPairDB.answer,
+        "created_at", _iso_utc(QAPairDB.created_at),
+        "card_type", func.coalesce(QAPairDB.card_type, "qa"),
+        "source_metadata", null(),
+        "source_content", null(),
+    )
+    qas = (
+        select(_json_array_agg(qa_json, "'[]'::jsonb", QAPairDB.order, QAPairDB.id))
+        .where(QAPairDB.cluster_id == ClusterDB.id)
+        .scalar_subquery()
+    )
+    
+    # Source notes are exposed as cards, mirroring convert_to_api_cluster_list
+    metadata = SourceNoteDB.source_metadata
+    content = SourceNoteDB.source_content
+    has_metadata = func.json_typeof(metadata) == "object"
+    has_content = func.json_typeof(content) == "object"
+    note_json = func.jsonb_build_object(
+        "_id", SourceNoteDB.source_note_id,
+        "question", case((has_metadata, metadata["title"].as_string()), else_="Source Note"),
+        "answer", case((has_content, content["summary"].as_string()), else_=""),
+        "created_at", _iso_utc(SourceNoteDB.created_at),
+        "card_type", "source_note",
+        "source_metadata", case((has_metadata, func.jsonb_build_object(
+            "title", metadata["title"],
+            "url", metadata["url"],
+            "author", metadata["author"],
+            "publication_date", metadata["publication_date"],
+            "source_type", metadata["source_type"],
+        )), else_=null()),
+        "source_content", case((has_content, func.jsonb_build_object(
+            "summary", content["summary"],
+            "key_takeaways", func.coalesce(content["key_takeaways"], literal_column("'[]'::json")),
+            "personal_notes", func.coalesce(content["personal_notes"], literal_column("'\"\"'::json")),
+            "tags", func.coalesce(content["tags"], literal_column("'[]'::json")),
+        )), else_=null()),
+    )
+    notes = (
+        select(_json_array_agg(note_json, "'[]'::jsonb", SourceNoteDB.id))
+        .where(SourceNoteDB.cluster_id == ClusterDB.id)
+        .scalar_subquery()
+    )
+    
+    cluster_json = func.jsonb_build_object("title", ClusterDB.title, "qas", qas.op("||")(notes))
+    clusters = (
+        select(_json_array_agg(cluster_json, "'[]'::jsonb", ClusterDB.id))
+        .where(ClusterDB.cluster_list_id == ClusterListDB.id)
+        .scalar_subquery()
+    )
+    return select(
+        # Cast to text so the driver returns the document as a string, ready to be
+        # sent as the response body, instead of decoding it into a dict
+        cast(
+            func.jsonb_build_object(
+                "id", ClusterListDB.list_id,
+                "title", ClusterListDB.title,
+                "clusters", clusters,
+            ),
+            Text
+        )
+    ).where(ClusterListDB.list_id == bindparam("list_id"))
+
+
+# Postgres assembles the nested document with jsonb_agg, so a read of a whole
+# cluster list needs no ORM hydration or Pydantic conversion in Python
+_GET_CLUSTER_LIST_JSON = _build_cluster_list_json_statement()
+
+
+def _next_qa_order(cluster_id: int):
+    """Scalar subquery for the order that appends a Q&A to the end of a cluster"""
+    # max(order) is answered from ix_qa_cluster_order without visiting the table
+    return (
+        select(func.coalesce(func.max(QAPairDB.order), -1) + 1)
+        .where(QAPairDB.cluster_id == cluster_id)
+        # Never correlate, so this also reads the whole cluster inside an UPDATE of qa_pairs
+        .correlate(None)
+        .scalar_subquery()
+    )
+
+
+# Process-local cache of get_cluster_list_info(); cluster lists change rarely,
+# so navigation reads are served from memory for a few seconds at a time.
+# Cleared on commit, so a list only appears or disappears once it is durable;
+# the generation keeps a read that overlapped the commit from storing its result
+CLUSTER_LIST_INFO_TTL_SECONDS = 5.0
+_cluster_list_info_cache: Optional[Tuple[float, List[ClusterListInfo]]] = None
+_cluster_list_info_generation = 0
+
+
+def invalidate_cluster_list_info_cache() -> None:
+    """Drop the cached cluster list info after a write"""
+    global _cluster_list_info_cache, _cluster_list_info_generation
+    _cluster_list_info_generation += 1
+    _cluster_list_info_cache = None
+
 
 class DatabaseService:
-    """Service layer for database operations"""
+    """Service layer for database operations
+    
+    Mutations are only flushed; the transaction is committed once per request,
+    either explicitly via commit() or when the session dependency closes.
+    """
     
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
     
+    async def commit(self) -> None:
+        """Commit the pending changes of the current unit of work"""
+        await self.session.commit()
+        invalidate_cluster_list_info_cache()
+    
     # ClusterList operations
-    def create_cluster_list(self, title: str) -> ClusterListDB:
+    async def create_cluster_list(self, title: str) -> ClusterListDB:
         """Create a new cluster list"""
-        cluster_list = ClusterListDB(title=title)
+        # A new list has no clusters; set the collection so it is never lazy loaded
+        cluster_list = ClusterListDB(title=title, clusters=[])
         self.session.add(cluster_list)
-        self.session.commit()
-        self.session.refresh(cluster_list)
+        await self.session.flush()
         return cluster_list
     
-    def get_cluster_list_by_id(self, list_id: str) -> Optional[ClusterListDB]:
-        """Get cluster list by UUID string ID"""
+    async def get_cluster_list_by_id(self, list_id: str, eager: bool = False) -> Optional[ClusterListDB]:
+        """Get cluster list by UUID string ID (eager=True also loads clusters and cards)"""
         try:
             from uuid import UUID
             # Ensure the input is a valid UUID string
             uuid_obj = UUID(str(list_id))
             # Look up by list_id (UUID) not the primary key id
-            return self.session.exec(
-                select(ClusterListDB).where(ClusterListDB.list_id == str(uuid_obj))
-            ).first()
+            statement = _GET_CLUSTER_LIST_BY_LIST_ID_EAGER if eager else _GET_CLUSTER_LIST_BY_LIST_ID
+            result = await self.session.exec(statement, params={"list_id": str(uuid_obj)})
+            return result.scalars().one_or_none()
         except (ValueError, AttributeError):
             return None
     
-    def get_all_cluster_lists(self) -> List[ClusterListDB]:
-        """Get all cluster lists"""
+    async def get_cluster_list_json(self, list_id: str) -> Optional[str]:
+        """Get a cluster list by UUID string ID as a serialized ClusterList document"""
+        try:
+            from uuid import UUID
+            list_id = str(UUID(str(list_id)))
+        except (ValueError, AttributeError):
+            return None
+        # Not cached in process: with several workers a copy here would outlive
+        # edits made through another worker; clients revalidate with ETag instead
+        result = await self.session.exec(_GET_CLUSTER_LIST_JSON, params={"list_id": list_id})
+        return result.one_or_none()
+    
+    async def get_all_cluster_lists(self, eager: bool = False) -> List[ClusterListDB]:
+        """Get all cluster lists (eager=True also loads clusters and cards)"""
         statement = select(ClusterListDB)
-        return list(self.session.exec(statement).all())
+        if eager:
+            statement = statement.options(*CLUSTER_LIST_EAGER_OPTIONS)
+        result = await self.session.exec(statement)
+        return list(result.all())
     
-    def get_cluster_list_info(self) -> List[ClusterListInfo]:
-        """Get cluster list info (id and title only)"""
-        cluster_lists = self.get_all_cluster_lists()
-        return [ClusterListInfo(id=cl.list_id, title=cl.title) for cl in cluster_lists]
+    async def get_first_cluster_list_id(self) -> Optional[str]:
+        """Get the UUID string ID of the oldest cluster list"""
+        result = await self.session.exec(
+            select(ClusterListDB.list_id).order_by(ClusterListDB.id).limit(1)
+        )
+        return result.first()
+    
+    async def get_cluster_list_info(self) -> List[ClusterListInfo]:
+        """Get cluster list info (id and title only), cached for a few seconds"""
+        global _cluster_list_info_cache
+        now = time.monotonic()
+        if _cluster_list_info_cache is not None and _cluster_list_info_cache[0] > now:
+            return list(_cluster_list_info_cache[1])
+        
+        generation = _cluster_list_info_generation
+        # Select just the two columns as rows instead of hydrating ClusterListDB objects
+        result = await self.session.exec(select(ClusterListDB.list_id, ClusterListDB.title))
+        info = [ClusterListInfo.model_construct(id=list_id, title=title) for list_id, title in result.all()]
+        if generation == _cluster_list_info_generation:
+            _cluster_list_info_cache = (now + CLUSTER_LIST_INFO_TTL_SECONDS, info)
+        return list(info)
     
     # Cluster operations
-    def create_cluster(self, cluster_list_uuid: str, title: str) -> ClusterDB:
+    async def create_cluster(self, cluster_list_uuid: str, title: str) -> ClusterDB:
         """Create a new cluster"""
         # First get the cluster list by its UUID to get the integer ID
-        cluster_list = self.session.exec(
-            select(ClusterListDB).where(ClusterListDB.list_id == cluster_list_uuid)
-        ).first()
+        result = await self.session.exec(
+            _GET_CLUSTER_LIST_BY_LIST_ID, params={"list_id": cluster_list_uuid}
+        )
+        cluster_list = result.scalars().one_or_none()
         if not cluster_list:
             raise ValueError(f"Cluster list with UUID {cluster_list_uuid} not found")
             
         cluster = ClusterDB(title=title, cluster_list_id=cluster_list.id)
         self.session.add(cluster)
-        self.session.commit()
-        self.session.refresh(cluster)
+        await self.session.flush()
         return cluster
     
-    def get_cluster_by_title(self, cluster_list_uuid: str, title: str) -> Optional[ClusterDB]:
-        """Get cluster by title (case insensitive)"""
+    async def get_cluster_by_title(self, cluster_list_uuid: str, title: str) -> Optional[ClusterDB]:
+        """Get cluster by title (case insensitive, already stripped) within the cluster list with the given UUID"""
         try:
-            print(f"[DEBUG] get_cluster_by_title - list_uuid: {cluster_list_uuid}, title: {title}")
-            # First find the cluster list by UUID to get its integer ID
-            print(f"[DEBUG] Looking up cluster list with UUID: {cluster_list_uuid}")
-            cluster_list = self.session.exec(
-                select(ClusterListDB).where(ClusterListDB.list_id == cluster_list_uuid)
-            ).first()
+            logger.debug("get_cluster_by_title - list_uuid: %s, title: '%s'", cluster_list_uuid, title)
             
-            if not cluster_list:
-                print(f"[DEBUG] Cluster list not found with UUID: {cluster_list_uuid}")
-                return None
-                
-            print(f"[DEBUG] Found cluster list - ID: {cluster_list.id}, Title: {cluster_list.title}")
-            
-            # Then find the cluster by title and the integer cluster_list_id
-            title_stripped = title.strip()
-            print(f"[DEBUG] Looking for cluster with title: '{title_stripped}' in list ID: {cluster_list.id}")
-            
-            statement = select(ClusterDB).where(
-                ClusterDB.cluster_list_id == cluster_list.id,
-                ClusterDB.title.ilike(title_stripped)
+            # Single query: join to the cluster list instead of looking it up first
+            result = await self.session.exec(
+                _GET_CLUSTER_BY_TITLE,
+                params={"list_id": cluster_list_uuid, "title": title.lower()}
             )
-            
-            # Print the generated SQL for debugging
-            print(f"[DEBUG] SQL Query: {statement}")
-            
-            cluster = self.session.exec(statement).first()
-            print(f"[DEBUG] Found cluster: {cluster}")
+            cluster = result.scalars().first()
+            logger.debug("Found cluster: %s", cluster)
             return cluster
             
-        except Exception as e:
-            print(f"[ERROR] Exception in get_cluster_by_title: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Exception in get_cluster_by_title")
             return None
     
-    def delete_cluster(self, cluster: ClusterDB) -> None:
-        """Delete a cluster and all its QAs"""
-        self.session.delete(cluster)
-        self.session.commit()
+    async def get_cluster_by_id(self, cluster_id: int) -> Optional[ClusterDB]:
+        """Get cluster by primary key"""
+        return await self.session.get(ClusterDB, cluster_id)
+    
+    async def get_cluster_qa_ids(self, cluster: ClusterDB) -> List[str]:
+        """Get the IDs of the Q&A pairs in a cluster"""
+        result = await self.session.exec(
+            select(QAPairDB.qa_id).where(QAPairDB.cluster_id == cluster.id)
+        )
+        return list(result.all())
+    
+    async def delete_cluster(self, cluster_id: int) -> None:
+        """Delete a cluster; its QAs and source notes go via ON DELETE CASCADE"""
+        await self.session.exec(delete(ClusterDB).where(ClusterDB.id == cluster_id))
     
-    def delete_cluster_list(self, cluster_list: ClusterListDB) -> None:
-        """Delete a cluster list and all its clusters and QAs"""
-        self.session.delete(cluster_list)
-        self.session.commit()
+    async def delete_cluster_list(self, cluster_list_id: int) -> None:
+        """Delete a cluster list; its clusters and QAs go via ON DELETE CASCADE"""
+        await self.session.exec(delete(ClusterListDB).where(ClusterListDB.id == cluster_list_id))
     
     # QAPair operations
-    def create_qa_pair(self, cluster_id: int, question: str, answer: str) -> QAPairDB:
-        """Create a new Q&A pair"""
-        qa_pair = QAPairDB(
-            question=question.strip(),
-            answer=answer.strip(),
-            cluster_id=cluster_id
+    async def create_qa_pair(self, cluster_id: int, question: str, answer: str) -> QAPairDB:
+        """Create a new Q&A pair (question and answer already stripped)"""
+        # Under READ COMMITTED two concurrent appends could both read the same
+        # max(order), so lock the cluster row first; appends to one cluster then
+        # run one after another until the transaction ends
+        await self.session.exec(_LOCK_CLUSTER, params={"cluster_id": cluster_id})
+        # The order is computed by the INSERT itself, which then returns the new row
+        result = await self.session.exec(
+            insert(QAPairDB)
+            .values(
+                qa_id=str(uuid4()),
+                question=question,
+                answer=answer,
+                created_at=datetime.utcnow(),
+                card_type="qa",
+                cluster_id=cluster_id,
+                order=_next_qa_order(cluster_id)
+            )
+            .returning(QAPairDB)
         )
-        self.session.add(qa_pair)
-        self.session.commit()
-        self.session.refresh(qa_pair)
-        return qa_pair
+        return result.scalars().one()
     
-    def get_qa_pair_by_id(self, qa_id: str) -> Optional[QAPairDB]:
+    async def get_qa_pair_by_id(self, qa_id: str) -> Optional[QAPairDB]:
         """Get Q&A pair by ID"""
-        statement = select(QAPairDB).where(QAPairDB.qa_id == qa_id)
-        return self.session.exec(statement).first()
+        result = await self.session.exec(_GET_QA_PAIR_BY_QA_ID, params={"qa_id": qa_id})
+        return result.scalars().one_or_none()
     
     def update_qa_pair(self, qa_pair: QAPairDB, question: Optional[str] = None, answer: Optional[str] = None) -> QAPairDB:
-        """Update a Q&A pair"""
-        if question is not None and question.strip():
-            qa_pair.question = question.strip()
-        if answer is not None and answer.strip():
-            qa_pair.answer = answer.strip()
-        
-        self.session.add(qa_pair)
-        self.session.commit()
-        self.session.refresh(qa_pair)
+        """Update a Q&A pair (question and answer already stripped)"""
+        if question:
+            qa_pair.question = question
+        if answer:
+            qa_pair.answer = answer
         return qa_pair
     
-    def move_qa_pair(self, qa_pair: QAPairDB, new_cluster: ClusterDB) -> QAPairDB:
-        """Move Q&A pair to a different cluster"""
-        qa_pair.cluster_id = new_cluster.id
-        self.session.add(qa_pair)
-        self.session.commit()
-        self.session.refresh(qa_pair)
+    async def move_qa_pair(self, qa_pair: QAPairDB, new_cluster: ClusterDB) -> QAPairDB:
+        """Move Q&A pair to the end of a different cluster"""
+        # Appends to the destination like create_qa_pair, under the same cluster row lock
+        await self.session.exec(_LOCK_CLUSTER, params={"cluster_id": new_cluster.id})
+        await self.session.exec(
+            update(QAPairDB)
+            .where(QAPairDB.id == qa_pair.id)
+            .values(cluster_id=new_cluster.id, order=_next_qa_order(new_cluster.id))
+            .execution_options(synchronize_session="fetch")
+        )
         return qa_pair
     
-    def delete_qa_pair(self, qa_pair: QAPairDB) -> None:
+    async def delete_qa_pair(self, qa_id: str) -> None:
         """Delete a Q&A pair"""
-        self.session.delete(qa_pair)
-        self.session.commit()
+        await self.session.exec(delete(QAPairDB).where(QAPairDB.qa_id == qa_id))
     
-    def reorder_qa_pairs(self, cluster: ClusterDB, ordered_qa_ids: List[str]) -> None:
+    async def reorder_qa_pairs(self, cluster: ClusterDB, ordered_qa_ids: List[str]) -> None:
         """Reorder Q&A pairs in a cluster"""
-        # For now, we'll implement this by updating a position field if needed
-        # Since SQLModel doesn't have built-in ordering, we could add a position field
-        # For this implementation, we'll rely on the frontend to handle ordering
-        pass
+        # Map qa_id -> primary key for the pairs that belong to this cluster
+        result = await self.session.exec(
+            select(QAPairDB.qa_id, QAPairDB.id).where(QAPairDB.cluster_id == cluster.id)
+        )
+        pk_by_qa_id = dict(result.all())
+        mappings = [
+            {"id": pk_by_qa_id[qa_id], "order": position}
+            for position, qa_id in enumerate(ordered_qa_ids)
+            if qa_id in pk_by_qa_id
+        ]
+        if not mappings:
+            return
+        # ORM bulk UPDATE by primary key: one executemany over a single statement
+        await self.session.exec(update(QAPairDB), params=mappings)
     
     # Conversion methods
     def convert_to_api_cluster_list(self, db_cluster_list: ClusterListDB) -> ClusterList:
-        """Convert database cluster list to API model"""
+        """Convert database cluster list to API model (clusters and cards must be loaded)"""
+        # Rows come from typed columns and validated writes, so the API models
+        # are built with model_construct() and skip per-field validation
         clusters = []
         for db_cluster in db_cluster_list.clusters:
             qas = []
             for db_qa in db_cluster.qas:
-                qa = QAPair(
-                    _id=db_qa.qa_id,
+                qa = QAPair.model_construct(
                     qa_id=db_qa.qa_id,
                     question=db_qa.question,
                     answer=db_qa.answer,
-                    created_at=db_qa.created_at.isoformat() + "Z",
+                    created_at=db_qa.created_at_iso,
                     card_type=db_qa.card_type or "qa"
                 )
                 qas.append(qa)
@@ -177,131 +388,136 @@ class DatabaseService:
             for db_source_note in db_cluster.source_notes:
                 source_metadata = None
                 if db_source_note.source_metadata:
-                    source_metadata = SourceMetadata(**db_source_note.source_metadata)
+                    source_metadata = SourceMetadata.model_construct(**db_source_note.source_metadata)
                 
                 source_content = None
                 if db_source_note.source_content:
-                    source_content = SourceContent(**db_source_note.source_content)
+                    source_content = SourceContent.model_construct(**db_source_note.source_content)
                 
-                source_qa = QAPair(
-                    _id=db_source_note.source_note_id,
+                source_qa = QAPair.model_construct(
                     qa_id=db_source_note.source_note_id,
                     question=source_metadata.title if source_metadata else "Source Note",
                     answer=source_content.summary if source_content else "",
-                    created_at=db_source_note.created_at.isoformat() + "Z",
+                    created_at=db_source_note.created_at_iso,
                     card_type="source_note",
                     source_metadata=source_metadata,
                     source_content=source_content
                 )
                 qas.append(source_qa)
             
-            cluster = Cluster(title=db_cluster.title, qas=qas)
+            cluster = Cluster.model_construct(title=db_cluster.title, qas=qas)
             clusters.append(cluster)
         
-        return ClusterList(
+        return ClusterList.model_construct(
             id=db_cluster_list.list_id,
             title=db_cluster_list.title,
             clusters=clusters
         )
     
-    def convert_to_api_cluster(self, db_cluster: ClusterDB) -> Cluster:
-        """Convert database cluster to API model"""
-        qas = []
-        for db_qa in db_cluster.qas:
-            qa = QAPair(
-                _id=db_qa.qa_id,
-                qa_id=db_qa.qa_id,
-                question=db_qa.question,
-                answer=db_qa.answer,
-                created_at=db_qa.created_at.isoformat() + "Z",
-                card_type=db_qa.card_type or "qa"
+    async def convert_to_api_cluster(self, db_cluster: ClusterDB) -> Cluster:
+        """Convert database cluster to API model, querying its cards"""
+        # Read the Q&A columns as plain rows; no ORM objects are needed here
+        qa_rows = await self.session.exec(
+            select(
+                QAPairDB.qa_id, QAPairDB.question, QAPairDB.answer,
+                QAPairDB.created_at, QAPairDB.card_type
             )
-            qas.append(qa)
+            .where(QAPairDB.cluster_id == db_cluster.id)
+            .order_by(QAPairDB.order, QAPairDB.id)
+        )
+        qas = [
+            QAPair.model_construct(
+                qa_id=qa_id,
+                question=question,
+                answer=answer,
+                created_at=created_at.isoformat(timespec="microseconds") + "Z",
+                card_type=card_type or "qa"
+            )
+            for qa_id, question, answer, created_at, card_type in qa_rows
+        ]
         
         # Add source notes as QAPair objects with card_type="source_note"
-        for db_source_note in db_cluster.source_notes:
+        source_notes = await self.session.exec(
+            select(SourceNoteDB)
+            .where(SourceNoteDB.cluster_id == db_cluster.id)
+            .order_by(SourceNoteDB.id)
+        )
+        for db_source_note in source_notes:
             source_metadata = None
             if db_source_note.source_metadata:
-                source_metadata = SourceMetadata(**db_source_note.source_metadata)
+                source_metadata = SourceMetadata.model_construct(**db_source_note.source_metadata)
             
             source_content = None
             if db_source_note.source_content:
-                source_content = SourceContent(**db_source_note.source_content)
+                source_content = SourceContent.model_construct(**db_source_note.source_content)
             
-            source_qa = QAPair(
-                _id=db_source_note.source_note_id,
+            source_qa = QAPair.model_construct(
                 qa_id=db_source_note.source_note_id,
                 question=source_metadata.title if source_metadata else "Source Note",
                 answer=source_content.summary if source_content else "",
-                created_at=db_source_note.created_at.isoformat() + "Z",
+                created_at=db_source_note.created_at_iso,
                 card_type="source_note",
                 source_metadata=source_metadata,
                 source_content=source_content
             )
             qas.append(source_qa)
         
-        return Cluster(title=db_cluster.title, qas=qas)
+        return Cluster.model_construct(title=db_cluster.title, qas=qas)
     
     def convert_to_api_qa_pair(self, db_qa: QAPairDB) -> QAPair:
         """Convert database Q&A pair to API model"""
-        return QAPair(
-            _id=db_qa.qa_id,
+        return QAPair.model_construct(
             qa_id=db_qa.qa_id,
             question=db_qa.question,
             answer=db_qa.answer,
-            created_at=db_qa.created_at.isoformat() + "Z",
+            created_at=db_qa.created_at_iso,
             card_type=db_qa.card_type or "qa"
         )
     
     # Source Note operations
-    def create_source_note(self, cluster_id: int, source_metadata: SourceMetadata, source_content: SourceContent) -> SourceNoteDB:
+    async def create_source_note(self, cluster_id: int, source_metadata: SourceMetadata, source_content: SourceContent) -> SourceNoteDB:
         """Create a new source note"""
         source_note = SourceNoteDB(
-            source_metadata=source_metadata.dict(),
-            source_content=source_content.dict(),
+            source_metadata=source_metadata.model_dump(mode="json"),
+            source_content=source_content.model_dump(mode="json"),
             cluster_id=cluster_id
         )
         self.session.add(source_note)
-        self.session.commit()
-        self.session.refresh(source_note)
+        await self.session.flush()
         return source_note
     
-    def get_source_note_by_id(self, source_note_id: str) -> Optional[SourceNoteDB]:
+    async def get_source_note_by_id(self, source_note_id: str) -> Optional[SourceNoteDB]:
         """Get source note by ID"""
-        statement = select(SourceNoteDB).where(SourceNoteDB.source_note_id == source_note_id)
-        return self.session.exec(statement).first()
+        result = await self.session.exec(
+            _GET_SOURCE_NOTE_BY_SOURCE_NOTE_ID, params={"source_note_id": source_note_id}
+        )
+        return result.scalars().one_or_none()
     
     def update_source_note(self, source_note: SourceNoteDB, source_metadata: Optional[SourceMetadata] = None, source_content: Optional[SourceContent] = None) -> SourceNoteDB:
         """Update a source note"""
         if source_metadata is not None:
-            source_note.source_metadata = source_metadata.dict()
+            source_note.source_metadata = source_metadata.model_dump(mode="json")
         if source_content is not None:
-            source_note.source_content = source_content.dict()
-        
-        self.session.add(source_note)
-        self.session.commit()
-        self.session.refresh(source_note)
+            source_note.source_content = source_content.model_dump(mode="json")
         return source_note
     
-    def delete_source_note(self, source_note: SourceNoteDB) -> None:
+    async def delete_source_note(self, source_note: SourceNoteDB) -> None:
         """Delete a source note"""
-        self.session.delete(source_note)
-        self.session.commit()
+        await self.session.delete(source_note)
     
     def convert_to_api_source_note(self, db_source_note: SourceNoteDB) -> SourceNote:
         """Convert database source note to API model"""
         source_metadata = None
         if db_source_note.source_metadata:
-            source_metadata = SourceMetadata(**db_source_note.source_metadata)
+            source_metadata = SourceMetadata.model_construct(**db_source_note.source_metadata)
         
         source_content = None
         if db_source_note.source_content:
-            source_content = SourceContent(**db_source_note.source_content)
+            source_content = SourceContent.model_construct(**db_source_note.source_content)
         
-        return SourceNote(
-            _id=db_source_note.source_note_id,
+        return SourceNote.model_construct(
             source_note_id=db_source_note.source_note_id,
             source_metadata=source_metadata,
             source_content=source_content,
-            created_at=db_source_note.created_at.isoformat() + "Z"
+            created_at=db_source_note.created_at_iso
         )
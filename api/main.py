@@ -1,98 +1,145 @@
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Application logging; set LOG_LEVEL=DEBUG to see per-request detail. Records are
+# handed to a queue and written to stderr by a listener thread, so request
+# handlers never block on the stream
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# The queued record carries only the rendered message; the listener adds the rest
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    handlers=[_log_queue_handler]
+)
+logger = logging.getLogger(__name__)
+
 from config import CORS_ORIGINS, CORS_ORIGIN_REGEX
-from database import create_db_and_tables
+from database import AUTOCREATE_TABLES, create_db_and_tables
 from services import AblyManager
 from routes import cluster_router, ably_router
 from routes.cluster_routes import set_ably_manager as set_cluster_ably_manager
 from routes.ably_routes import set_ably_manager as set_ably_ably_manager
 
-# -----------------------------
-# FastAPI App Setup
-# -----------------------------
-app = FastAPI(
-    title="ThinkEx Clusters API",
-    description="PostgreSQL-backed clusters API with real-time updates via Ably.",
-    version="2.0.0"
-)
+class AllowListCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that checks the exact-origin allow list before the regex"""
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=CORS_ORIGINS,
-    allow_origin_regex=CORS_ORIGIN_REGEX,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        # Listed origins are a set lookup; only unlisted ones (deploy previews) hit the regex
+        return origin in self.allow_origins or super().is_allowed_origin(origin)
 
-# Include routers
-app.include_router(cluster_router)
-app.include_router(ably_router)
 
 # Global manager instance
 manager = None
 
+# How long startup waits for Ably Realtime before leaving it to finish in the background
+ABLY_CONNECT_TIMEOUT_SECONDS = 5
+
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database and Ably clients on startup"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database and Ably clients on startup and clean them up on shutdown"""
     global manager
-    print("Starting up FastAPI application...")
+    logger.info("Starting up FastAPI application...")
     
-    # Create database tables
-    print("Creating database tables...")
-    create_db_and_tables()
-    print("Database tables created successfully.")
+    # Tables come from Alembic migrations; only create them here when opted in
+    if AUTOCREATE_TABLES:
+        logger.info("Creating database tables...")
+        await create_db_and_tables()
+        logger.info("Database tables created successfully.")
     
     # Initialize Ably manager
     manager = AblyManager()
     if manager.ably_rest:
-        print("Ably REST client initialized for token requests.")
+        logger.info("Ably REST client initialized for token requests.")
     else:
-        print("ABLY_API_KEY not found. Ably REST client not initialized.")
+        logger.warning("ABLY_API_KEY not found. Ably REST client not initialized.")
 
     # Set the manager in route modules
     set_cluster_ably_manager(manager)
     set_ably_ably_manager(manager)
 
-    # Start Ably Realtime connection as a background task
-    asyncio.create_task(manager.initialize_realtime())
-    
-    # Give it a moment to establish connection
-    await asyncio.sleep(2)
+    # Connect to Ably Realtime; startup returns as soon as it is connected, and
+    # a slow connection keeps going in the background instead of failing
+    realtime_task = asyncio.create_task(manager.initialize_realtime())
+    try:
+        await asyncio.wait_for(asyncio.shield(realtime_task), timeout=ABLY_CONNECT_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        pass
     
     if manager.is_ready():
-        print("Ably Realtime connection ready for broadcasting.")
+        logger.info("Ably Realtime connection ready for broadcasting.")
     else:
-        print("Ably Realtime connection not yet available, will be ready in background.")
+        logger.info("Ably Realtime connection not yet available, will be ready in background.")
 
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up Ably connection on shutdown"""
-    global manager
-    print("Shutting down FastAPI application...")
-    
-    if manager:
-        await manager.close()
-    
-    print("Ably connection cleanup completed")
+    logger.info("Shutting down FastAPI application...")
+    if not realtime_task.done():
+        realtime_task.cancel()
+    await manager.close()
+    logger.info("Ably connection cleanup completed")
+
+
+# -----------------------------
+# FastAPI App Setup
+# -----------------------------
+app = FastAPI(
+    title="ThinkEx Clusters API",
+    description="PostgreSQL-backed clusters API with real-time updates via Ably.",
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# CORS middleware
+app.add_middleware(
+    AllowListCORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_origin_regex=CORS_ORIGIN_REGEX,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Compress large JSON bodies (cluster list documents); small responses go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Include routers
+app.include_router(cluster_router)
+app.include_router(ably_router)
 
 
 # Health check endpoint
 @app.get("/", tags=["meta"])
-def root():
+async def root():
     """Health check endpoint"""
     return {"status": "ok", "message": "ThinkEx API is running with PostgreSQL backend"}
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]; ask for them explicitly
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -1,8 +1,20 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, List, Optional, Dict, Any
 from uuid import uuid4
 from datetime import datetime
 
+# Bound once; the factory runs for every model built without a created_at
+_utcnow = datetime.utcnow
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as the ISO-8601 'Z' string used for created_at"""
+    return _utcnow().isoformat(timespec="microseconds") + "Z"
+
+
+# Request text normalized once at parse time, so routes don't re-strip it
+StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
 
 # Source Note Models (defined first since they're referenced in QAPair)
 class SourceMetadata(BaseModel):
@@ -24,7 +36,7 @@ class QAPair(BaseModel):
     qa_id: str = Field(..., alias='_id')
     question: str
     answer: str
-    created_at: Optional[str] = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    created_at: Optional[str] = Field(default_factory=_utc_now_iso)
     card_type: Optional[str] = Field(default="qa")
     # Source note specific fields
     source_metadata: Optional[SourceMetadata] = None
@@ -47,9 +59,9 @@ class ClusterList(BaseModel):
 
 class AddQARequest(BaseModel):
     cluster_list_id: str
-    clusterName: str
-    question: str
-    answer: str
+    clusterName: StrippedStr
+    question: StrippedStr
+    answer: StrippedStr
 
 
 class AddQAResponse(BaseModel):
@@ -59,10 +71,10 @@ class AddQAResponse(BaseModel):
 
 class UpdateQARequest(BaseModel):
     cluster_list_id: str
-    clusterName: str
+    clusterName: StrippedStr
     qa_id: str
-    question: Optional[str] = None
-    answer: Optional[str] = None
+    question: Optional[StrippedStr] = None
+    answer: Optional[StrippedStr] = None
 
 
 class UpdateQAResponse(BaseModel):
@@ -76,7 +88,7 @@ class ClusterListInfo(BaseModel):
 
 
 class MoveQARequest(BaseModel):
-    new_cluster_title: str
+    new_cluster_title: StrippedStr
 
 
 class MoveQAResponse(BaseModel):
@@ -87,7 +99,7 @@ class MoveQAResponse(BaseModel):
 
 
 class ReorderQAsRequest(BaseModel):
-    cluster_title: str
+    cluster_title: StrippedStr
     ordered_qa_ids: List[str]
 
 
@@ -116,7 +128,7 @@ class SourceNote(BaseModel):
     source_note_id: str = Field(..., alias='_id')
     source_metadata: Optional[SourceMetadata] = None
     source_content: Optional[SourceContent] = None
-    created_at: Optional[str] = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    created_at: Optional[str] = Field(default_factory=_utc_now_iso)
     card_type: str = Field(default="source_note")
 
     class Config:
@@ -125,7 +137,7 @@ class SourceNote(BaseModel):
 
 class AddSourceNoteRequest(BaseModel):
     cluster_list_id: str
-    cluster_name: str
+    cluster_name: StrippedStr
     source_metadata: SourceMetadata
     source_content: SourceContent
 
@@ -137,7 +149,7 @@ class AddSourceNoteResponse(BaseModel):
 
 class UpdateSourceNoteRequest(BaseModel):
     cluster_list_id: str
-    cluster_name: str
+    cluster_name: StrippedStr
     source_metadata: Optional[SourceMetadata] = None
     source_content: Optional[SourceContent] = None
 
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlalchemy import Index, func
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from uuid import uuid4
@@ -14,16 +15,28 @@ class QAPairDB(SQLModel, table=True):
     answer: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
+    # Position of the Q&A pair within its cluster
+    order: int = Field(default=0)
+    
     # Card type to distinguish between different types of cards
     card_type: Optional[str] = Field(default="qa", index=True)
     
     # Foreign key to cluster
-    cluster_id: Optional[int] = Field(default=None, foreign_key="clusters.id")
+    cluster_id: Optional[int] = Field(default=None, foreign_key="clusters.id", ondelete="CASCADE")
     cluster: Optional["ClusterDB"] = Relationship(back_populates="qas")
     
     # Foreign key to source note (if this is a source note)
     source_note_id: Optional[int] = Field(default=None, foreign_key="source_notes.id")
     source_note: Optional["SourceNoteDB"] = Relationship(back_populates="qa_pairs")
+    
+    @property
+    def created_at_iso(self) -> str:
+        """Creation time as the ISO-8601 UTC string exposed by the API"""
+        return self.created_at.isoformat(timespec="microseconds") + "Z"
+
+
+# Serves ordered reads of a cluster's Q&As and the next-order lookup on insert
+Index("ix_qa_cluster_order", QAPairDB.cluster_id, QAPairDB.order)
 
 
 class ClusterDB(SQLModel, table=True):
@@ -35,14 +48,22 @@ class ClusterDB(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     # Foreign key to cluster list
-    cluster_list_id: Optional[int] = Field(default=None, foreign_key="cluster_lists.id")
+    cluster_list_id: Optional[int] = Field(default=None, foreign_key="cluster_lists.id", ondelete="CASCADE")
     cluster_list: Optional["ClusterListDB"] = Relationship(back_populates="clusters")
     
     # Relationship to Q&A pairs
-    qas: List[QAPairDB] = Relationship(back_populates="cluster")
+    qas: List[QAPairDB] = Relationship(
+        back_populates="cluster",
+        passive_deletes=True,
+        sa_relationship_kwargs={"order_by": "[QAPairDB.order, QAPairDB.id]"}
+    )
     
     # Relationship to source notes
-    source_notes: List["SourceNoteDB"] = Relationship(back_populates="cluster")
+    source_notes: List["SourceNoteDB"] = Relationship(back_populates="cluster", passive_deletes=True)
+
+
+# Serves case-insensitive title lookups within a cluster list
+Index("ix_clusters_list_id_lower_title", ClusterDB.cluster_list_id, func.lower(ClusterDB.title))
 
 
 class ClusterListDB(SQLModel, table=True):
@@ -55,7 +76,11 @@ class ClusterListDB(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     # Relationship to clusters
-    clusters: List[ClusterDB] = Relationship(back_populates="cluster_list")
+    clusters: List[ClusterDB] = Relationship(
+        back_populates="cluster_list",
+        passive_deletes=True,
+        sa_relationship_kwargs={"order_by": "ClusterDB.id"}
+    )
 
 
 class SourceNoteDB(SQLModel, table=True):
@@ -73,8 +98,13 @@ class SourceNoteDB(SQLModel, table=True):
     source_content: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
     
     # Foreign key to cluster
-    cluster_id: Optional[int] = Field(default=None, foreign_key="clusters.id")
+    cluster_id: Optional[int] = Field(default=None, foreign_key="clusters.id", ondelete="CASCADE")
     cluster: Optional["ClusterDB"] = Relationship(back_populates="source_notes")
     
     # Relationship to Q&A pairs (for source notes that have associated Q&As)
     qa_pairs: List[QAPairDB] = Relationship(back_populates="source_note")
+    
+    @property
+    def created_at_iso(self) -> str:
+        """Creation time as the ISO-8601 UTC string exposed by the API"""
+        return self.created_at.isoformat(timespec="microseconds") + "Z"
@@ -1,10 +1,19 @@
+import logging
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from datetime import datetime
 from services.ably_manager import AblyManager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Token request parameters shared by every client; only the client id varies
+ABLY_TOKEN_BASE_PARAMS = {
+    'capability': {'*': ['*']},  # Full access for now
+    'ttl': 3600 * 1000  # 1 hour in milliseconds
+}
+
 # Global manager instance - will be set in main.py
 manager: Optional[AblyManager] = None
 
@@ -20,9 +29,6 @@ async def ably_token_request(clientId: Optional[str] = Query(None)):
     """
     Generate Ably token for secure client authentication
     """
-    print("=== ABLY TOKEN REQUEST START ===")
-    print(f"Received clientId parameter: {clientId}")
-
     if not manager or not manager.ably_rest:
         raise HTTPException(
             status_code=500, 
@@ -31,17 +37,12 @@ async def ably_token_request(clientId: Optional[str] = Query(None)):
 
     # Generate client ID
     client_id = clientId or f"thinkex-client-{datetime.utcnow().timestamp()}"
-    print(f"Using client_id: {client_id}")
+    logger.debug("Creating Ably token request for client_id %s", client_id)
     
     try:
         # Create token request with proper parameters as per Ably docs
-        token_request_params = {
-            'clientId': client_id,
-            'capability': {'*': ['*']},  # Full access for now
-            'ttl': 3600 * 1000  # 1 hour in milliseconds
-        }
+        token_request_params = {**ABLY_TOKEN_BASE_PARAMS, 'client_id': client_id}
         
-        print("Calling create_token_request using shared client...")
         # Use the shared AblyRest client from the manager
         token_request = await manager.ably_rest.auth.create_token_request(token_request_params)
 
@@ -57,19 +58,8 @@ async def ably_token_request(clientId: Optional[str] = Query(None)):
             "timestamp": token_request.timestamp
         }
 
-        print(f"Token request created successfully. Returning JSON: {response_data}")
-        print("=== ABLY TOKEN REQUEST SUCCESS ===")
         return response_data
-    except ImportError as e:
-        print(f"Import error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Ably import error: {str(e)}")
-    except AttributeError as e:
-        print(f"Attribute error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Ably attribute error: {str(e)}")
     except Exception as e:
-        print(f"General error type: {type(e)}")
-        print(f"General error message: {str(e)}")
-        print(f"General error args: {e.args}")
-        import traceback
-        print(f"Full traceback: {traceback.format_exc()}")
+        # One line per failure; a traceback per request would flood the log during an outage
+        logger.error("Failed to generate Ably token: %r", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate Ably token: {str(e)}")
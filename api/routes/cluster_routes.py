@@ -1,5 +1,8 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlmodel import Session
+import hashlib
+import logging
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional
 from database import get_session, DatabaseService
 from models import (
@@ -13,6 +16,8 @@ from models import (
 from services.ably_manager import AblyManager
 from fastapi import Query
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 # Global manager instance - will be set in main.py
@@ -25,17 +30,35 @@ def set_ably_manager(ably_manager: AblyManager):
     manager = ably_manager
 
 
-def get_database_service(session: Session = Depends(get_session)) -> DatabaseService:
+# Dependencies are async so FastAPI calls them inline instead of via the threadpool
+async def get_database_service(session: AsyncSession = Depends(get_session)) -> DatabaseService:
     """Get database service instance"""
     return DatabaseService(session)
 
 
-def get_ably_manager(ably_manager: AblyManager = Depends()):
-    """Get Ably manager instance"""
-    return ably_manager
+async def get_ably_manager() -> Optional[AblyManager]:
+    """Get the shared Ably manager instance set up at startup"""
+    return manager
+
+
+# Clients may keep a copy but must revalidate it (cheap 304s) before every reuse
+CLUSTER_LIST_CACHE_CONTROL = "private, no-cache"
 
 
-@router.post("/cluster-lists", response_model=ClusterList, operation_id="create_cluster_list")
+def cluster_list_json_response(request: Request, cluster_list_json: str) -> Response:
+    """Send a serialized cluster list with an ETag, or 304 if the client already has it"""
+    body = cluster_list_json.encode()
+    headers = {
+        "ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"',
+        "Cache-Control": CLUSTER_LIST_CACHE_CONTROL,
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or headers["ETag"] in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.post("/cluster-lists", responses={200: {"model": ClusterList}}, operation_id="create_cluster_list")
 async def create_cluster_list(
     payload: CreateClusterListRequest,
     db_service: DatabaseService = Depends(get_database_service)
@@ -43,8 +66,10 @@ async def create_cluster_list(
     """
     create_cluster_list(title) -> creates a new, empty cluster list.
     """
-    db_cluster_list = db_service.create_cluster_list(payload.title)
+    db_cluster_list = await db_service.create_cluster_list(payload.title)
     
+    await db_service.commit()
+
     # Broadcast the update
     if manager and manager.is_ready():
         await manager.broadcast({
@@ -54,69 +79,79 @@ async def create_cluster_list(
             }
         })
     
-    return db_service.convert_to_api_cluster_list(db_cluster_list)
+    return ORJSONResponse(db_service.convert_to_api_cluster_list(db_cluster_list).model_dump(by_alias=True))
 
 
-@router.get("/cluster-lists", response_model=List[ClusterList], operation_id="get_all_cluster_lists")
-def get_all_cluster_lists(db_service: DatabaseService = Depends(get_database_service)):
+# Endpoints return ready-made responses; their schemas are documented with
+# `responses=` so FastAPI does not re-validate and re-encode the output
+@router.get("/cluster-lists", responses={200: {"model": List[ClusterList]}}, operation_id="get_all_cluster_lists")
+async def get_all_cluster_lists(db_service: DatabaseService = Depends(get_database_service)):
     """
     get_all_cluster_lists() -> returns all cluster lists.
     """
-    db_cluster_lists = db_service.get_all_cluster_lists()
-    return [db_service.convert_to_api_cluster_list(cl) for cl in db_cluster_lists]
+    db_cluster_lists = await db_service.get_all_cluster_lists(eager=True)
+    # Serialize directly with orjson; the models were just built from DB rows
+    return ORJSONResponse([
+        db_service.convert_to_api_cluster_list(cl).model_dump(by_alias=True)
+        for cl in db_cluster_lists
+    ])
 
 
-@router.get("/cluster-lists/info", response_model=List[ClusterListInfo], operation_id="get_all_cluster_list_info")
-def get_all_cluster_list_info(db_service: DatabaseService = Depends(get_database_service)):
+@router.get("/cluster-lists/info", responses={200: {"model": List[ClusterListInfo]}}, operation_id="get_all_cluster_list_info")
+async def get_all_cluster_list_info(db_service: DatabaseService = Depends(get_database_service)):
     """
     get_all_cluster_list_info() -> returns all cluster lists with just their id and title.
     """
-    return db_service.get_cluster_list_info()
+    return ORJSONResponse([info.model_dump() for info in await db_service.get_cluster_list_info()])
 
 
 @router.get(
     "/cluster-lists/{cluster_list_id}", 
-    response_model=ClusterList, 
+    responses={200: {"model": ClusterList}}, 
     operation_id="get_cluster_list_by_id",
 )
-def get_cluster_list_by_id(
+async def get_cluster_list_by_id(
     cluster_list_id: str,
+    request: Request,
     db_service: DatabaseService = Depends(get_database_service)
 ):
     """
     get_cluster_list_by_id() -> returns a specific ClusterList by its ID
     """
-    db_cluster_list = db_service.get_cluster_list_by_id(cluster_list_id)
-    if not db_cluster_list:
+    # The document is built by Postgres, so it is sent as-is without re-serializing
+    cluster_list_json = await db_service.get_cluster_list_json(cluster_list_id)
+    if cluster_list_json is None:
         raise HTTPException(status_code=404, detail=f"ClusterList with id '{cluster_list_id}' not found.")
-    return db_service.convert_to_api_cluster_list(db_cluster_list)
+    return cluster_list_json_response(request, cluster_list_json)
 
 
-@router.delete("/cluster-lists/{cluster_list_id}", response_model=DeleteClusterListResponse, operation_id="delete_cluster_list")
+@router.delete("/cluster-lists/{cluster_list_id}", responses={200: {"model": DeleteClusterListResponse}}, operation_id="delete_cluster_list")
 async def delete_cluster_list(
     cluster_list_id: str,
     db_service: DatabaseService = Depends(get_database_service),
-    manager: AblyManager = Depends(get_ably_manager)
+    manager: Optional[AblyManager] = Depends(get_ably_manager)
 ):
     """Delete an entire cluster list and all its clusters and QAs"""
-    print(f"[DEBUG] DELETE cluster list endpoint called with ID: {cluster_list_id}")
+    logger.debug("DELETE cluster list endpoint called with ID: %s", cluster_list_id)
     
     # Get the cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(cluster_list_id)
+    db_cluster_list = await db_service.get_cluster_list_by_id(cluster_list_id)
     if not db_cluster_list:
-        print(f"[DEBUG] Cluster list not found with ID: {cluster_list_id}")
+        logger.debug("Cluster list not found with ID: %s", cluster_list_id)
         raise HTTPException(status_code=404, detail=f"Cluster list with id '{cluster_list_id}' not found.")
     
     cluster_list_title = db_cluster_list.title
-    print(f"[DEBUG] Found cluster list: {cluster_list_title}")
+    logger.debug("Found cluster list: %s", cluster_list_title)
     
     # Delete the cluster list (this will cascade delete all clusters and QAs)
-    db_service.delete_cluster_list(db_cluster_list)
-    print(f"[DEBUG] Deleted cluster list from database")
+    await db_service.delete_cluster_list(db_cluster_list.id)
+    logger.debug("Deleted cluster list from database")
     
+    await db_service.commit()
+
     # Broadcast the update
     if manager and manager.is_ready():
-        print(f"[DEBUG] Broadcasting cluster list deletion update")
+        logger.debug("Broadcasting cluster list deletion update")
         await manager.broadcast({
             "type": "cluster_list_update",
             "payload": {
@@ -124,19 +159,19 @@ async def delete_cluster_list(
             }
         })
     else:
-        print(f"[DEBUG] Manager not ready, skipping broadcast")
+        logger.debug("Manager not ready, skipping broadcast")
     
-    print(f"[DEBUG] Returning success response for cluster list deletion")
-    return DeleteClusterListResponse(
+    logger.debug("Returning success response for cluster list deletion")
+    return ORJSONResponse(DeleteClusterListResponse.model_construct(
         message=f"Deleted cluster list '{cluster_list_title}' and all its content.",
         clusterListId=cluster_list_id,
         clusterListTitle=cluster_list_title
-    )
+    ).model_dump(by_alias=True))
 
 
 @router.patch(
     "/cluster-lists/{cluster_list_id}/qa/{qa_id}/move",
-    response_model=MoveQAResponse,
+    responses={200: {"model": MoveQAResponse}},
     operation_id="move_qa_to_cluster",
 )
 async def move_qa_to_cluster(
@@ -148,68 +183,71 @@ async def move_qa_to_cluster(
     """
     move_qa_to_cluster(cluster_list_id, qa_id, new_cluster_title) -> moves a Q/A to a new cluster.
     """
-    print(f"[DEBUG] move_qa_to_cluster called with: cluster_list_id={cluster_list_id}, qa_id={qa_id}, payload={payload}")
+    logger.debug("move_qa_to_cluster called with: cluster_list_id=%s, qa_id=%s, payload=%s", cluster_list_id, qa_id, payload)
     
-    new_cluster_title = payload.new_cluster_title.strip()
+    new_cluster_title = payload.new_cluster_title
     if not new_cluster_title:
         error_msg = "new_cluster_title must be non-empty"
-        print(f"[ERROR] {error_msg}")
+        logger.warning(error_msg)
         raise HTTPException(status_code=400, detail=error_msg)
 
     # Get cluster list
-    print(f"[DEBUG] Looking up cluster list with ID: {cluster_list_id}")
-    db_cluster_list = db_service.get_cluster_list_by_id(cluster_list_id)
-    print(f"[DEBUG] Found cluster list: {db_cluster_list}")
+    logger.debug("Looking up cluster list with ID: %s", cluster_list_id)
+    db_cluster_list = await db_service.get_cluster_list_by_id(cluster_list_id)
+    logger.debug("Found cluster list: %s", db_cluster_list)
     
     if not db_cluster_list:
         error_msg = f"ClusterList with id '{cluster_list_id}' not found."
-        print(f"[ERROR] {error_msg}")
+        logger.warning(error_msg)
         raise HTTPException(status_code=404, detail=error_msg)
 
     # Get Q&A pair
-    print(f"[DEBUG] Looking up Q/A pair with ID: {qa_id}")
-    qa_pair = db_service.get_qa_pair_by_id(qa_id)
-    print(f"[DEBUG] Found Q/A pair: {qa_pair}")
+    logger.debug("Looking up Q/A pair with ID: %s", qa_id)
+    qa_pair = await db_service.get_qa_pair_by_id(qa_id)
+    logger.debug("Found Q/A pair: %s", qa_pair)
     
     if not qa_pair:
         error_msg = f"Q/A with id '{qa_id}' not found."
-        print(f"[ERROR] {error_msg}")
+        logger.warning(error_msg)
         raise HTTPException(status_code=404, detail=error_msg)
 
     # Get old cluster title
-    old_cluster_title = qa_pair.cluster.title if qa_pair.cluster else ""
-    print(f"[DEBUG] Current cluster for Q/A: {old_cluster_title}")
+    old_cluster = await db_service.get_cluster_by_id(qa_pair.cluster_id) if qa_pair.cluster_id else None
+    old_cluster_title = old_cluster.title if old_cluster else ""
+    logger.debug("Current cluster for Q/A: %s", old_cluster_title)
 
     # Get destination cluster
-    print(f"[DEBUG] Looking up destination cluster with title: {new_cluster_title}")
-    dest_cluster = db_service.get_cluster_by_title(cluster_list_id, new_cluster_title)
-    print(f"[DEBUG] Found destination cluster: {dest_cluster}")
+    logger.debug("Looking up destination cluster with title: %s", new_cluster_title)
+    dest_cluster = await db_service.get_cluster_by_title(cluster_list_id, new_cluster_title)
+    logger.debug("Found destination cluster: %s", dest_cluster)
     
     if not dest_cluster:
         error_msg = f"Destination cluster '{new_cluster_title}' not found in list '{cluster_list_id}'."
-        print(f"[ERROR] {error_msg}")
+        logger.warning(error_msg)
         raise HTTPException(status_code=404, detail=error_msg)
 
     # If source and destination are the same, do nothing
     if qa_pair.cluster_id == dest_cluster.id:
         msg = "Source and destination clusters are the same. No action taken."
-        print(f"[INFO] {msg}")
-        return MoveQAResponse(
+        logger.info(msg)
+        return ORJSONResponse(MoveQAResponse.model_construct(
             message=msg,
             qa_id=qa_id,
             old_cluster_title=old_cluster_title,
             new_cluster_title=new_cluster_title
-        )
+        ).model_dump(by_alias=True))
 
-    print(f"[DEBUG] Moving Q/A from cluster ID {qa_pair.cluster_id} to {dest_cluster.id}")
+    logger.debug("Moving Q/A from cluster ID %s to %s", qa_pair.cluster_id, dest_cluster.id)
     
     # Move the Q&A pair
-    db_service.move_qa_pair(qa_pair, dest_cluster)
-    print("[DEBUG] Successfully moved Q/A pair in database")
+    await db_service.move_qa_pair(qa_pair, dest_cluster)
+    logger.debug("Successfully moved Q/A pair in database")
+
+    await db_service.commit()
 
     # Broadcast the update
     if manager and manager.is_ready():
-        print("[DEBUG] Broadcasting update to connected clients")
+        logger.debug("Broadcasting update to connected clients")
         await manager.broadcast({
             "type": "cluster_list_update",
             "payload": {
@@ -217,17 +255,17 @@ async def move_qa_to_cluster(
             }
         })
     else:
-        print("[WARNING] Manager not ready, skipping broadcast")
+        logger.debug("Manager not ready, skipping broadcast")
 
     msg = f"Moved Q/A from '{old_cluster_title}' to '{new_cluster_title}'."
-    print(f"[INFO] {msg}")
+    logger.info(msg)
     
-    return MoveQAResponse(
+    return ORJSONResponse(MoveQAResponse.model_construct(
         message=msg,
         qa_id=qa_id,
         old_cluster_title=old_cluster_title,
         new_cluster_title=new_cluster_title
-    )
+    ).model_dump(by_alias=True))
 
 
 @router.patch("/cluster-lists/{cluster_list_id}/reorder", status_code=200)
@@ -236,24 +274,24 @@ async def reorder_qas_in_cluster(
     request: ReorderQAsRequest,
     db_service: DatabaseService = Depends(get_database_service)
 ):
-    # Get cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(cluster_list_id)
-    if not db_cluster_list:
-        raise HTTPException(status_code=404, detail="Cluster list not found")
-
-    # Get cluster
-    cluster = db_service.get_cluster_by_title(db_cluster_list.id, request.cluster_title)
+    # Get cluster (scoped to the list); the list itself is only checked to explain a miss
+    cluster = await db_service.get_cluster_by_title(cluster_list_id, request.cluster_title)
     if not cluster:
+        if not await db_service.get_cluster_list_by_id(cluster_list_id):
+            raise HTTPException(status_code=404, detail="Cluster list not found")
         raise HTTPException(status_code=404, detail=f"Cluster '{request.cluster_title}' not found")
 
-    # For now, we'll just validate the QA IDs exist
-    # In a full implementation, you might add a position field to QAPairDB
-    qa_map = {qa.qa_id: qa for qa in cluster.qas}
+    cluster_qa_ids = await db_service.get_cluster_qa_ids(cluster)
     
     # Check if all original QAs are still present
-    if len(request.ordered_qa_ids) != len(cluster.qas) or set(request.ordered_qa_ids) != set(qa_map.keys()):
+    if len(request.ordered_qa_ids) != len(cluster_qa_ids) or set(request.ordered_qa_ids) != set(cluster_qa_ids):
         raise HTTPException(status_code=400, detail="Mismatched QA items during reorder")
 
+    # Persist the new order
+    await db_service.reorder_qa_pairs(cluster, request.ordered_qa_ids)
+
+    await db_service.commit()
+
     # Broadcast the update
     if manager and manager.is_ready():
         await manager.broadcast({
@@ -269,21 +307,22 @@ async def reorder_qas_in_cluster(
 # For backward compatibility with the current frontend, which expects /clusters
 @router.get(
     "/clusters", 
-    response_model=ClusterList, 
+    responses={200: {"model": ClusterList}}, 
     operation_id="get_clusters",
 )
-def get_clusters(db_service: DatabaseService = Depends(get_database_service)):
+async def get_clusters(request: Request, db_service: DatabaseService = Depends(get_database_service)):
     """
     get_clusters() -> returns the *first* ClusterList for backward compatibility.
     """
-    db_cluster_lists = db_service.get_all_cluster_lists()
-    if not db_cluster_lists:
+    # Only the first list is needed, so load just that one, pre-serialized
+    list_id = await db_service.get_first_cluster_list_id()
+    cluster_list_json = await db_service.get_cluster_list_json(list_id) if list_id else None
+    if cluster_list_json is None:
         raise HTTPException(status_code=404, detail="No cluster lists found.")
-    # Return the first one found
-    return db_service.convert_to_api_cluster_list(db_cluster_lists[0])
+    return cluster_list_json_response(request, cluster_list_json)
 
 
-@router.post("/update_qa", response_model=UpdateQAResponse, operation_id="update_qa")
+@router.post("/update_qa", responses={200: {"model": UpdateQAResponse}}, operation_id="update_qa")
 async def update_qa(
     payload: UpdateQARequest,
     db_service: DatabaseService = Depends(get_database_service)
@@ -294,13 +333,7 @@ async def update_qa(
     """
     if not payload.cluster_list_id:
         raise HTTPException(status_code=400, detail="cluster_list_id must be provided")
-
-    # Get cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(payload.cluster_list_id)
-    if not db_cluster_list:
-        raise HTTPException(status_code=404, detail=f"ClusterList with id '{payload.cluster_list_id}' not found.")
-
-    cluster_name = payload.clusterName.strip()
+    cluster_name = payload.clusterName
     if not cluster_name:
         raise HTTPException(status_code=400, detail="clusterName must be non-empty")
     if not payload.qa_id:
@@ -308,32 +341,33 @@ async def update_qa(
     if payload.question is None and payload.answer is None:
         raise HTTPException(status_code=400, detail="At least one of 'question' or 'answer' must be provided for an update.")
 
-    # Get cluster
-    cluster = db_service.get_cluster_by_title(db_cluster_list.id, cluster_name)
+    # Get cluster (scoped to the list); the list itself is only checked to explain a miss
+    cluster = await db_service.get_cluster_by_title(payload.cluster_list_id, cluster_name)
     if not cluster:
+        if not await db_service.get_cluster_list_by_id(payload.cluster_list_id):
+            raise HTTPException(status_code=404, detail=f"ClusterList with id '{payload.cluster_list_id}' not found.")
         raise HTTPException(status_code=404, detail=f"Cluster '{cluster_name}' not found in list '{payload.cluster_list_id}'.")
 
     # Get Q&A pair
-    qa_pair = db_service.get_qa_pair_by_id(payload.qa_id)
+    qa_pair = await db_service.get_qa_pair_by_id(payload.qa_id)
     if not qa_pair or qa_pair.cluster_id != cluster.id:
         raise HTTPException(status_code=404, detail=f"Q/A with id '{payload.qa_id}' not found in cluster '{cluster_name}'.")
 
     # Check if there are actual changes
-    question_changed = (payload.question is not None and 
-                       payload.question.strip() and 
-                       payload.question.strip() != qa_pair.question)
-    answer_changed = (payload.answer is not None and 
-                     payload.answer.strip() and 
-                     payload.answer.strip() != qa_pair.answer)
+    question, answer = payload.question, payload.answer
+    question_changed = bool(question) and question != qa_pair.question
+    answer_changed = bool(answer) and answer != qa_pair.answer
 
     if not question_changed and not answer_changed:
-        return UpdateQAResponse(
+        return ORJSONResponse(UpdateQAResponse.model_construct(
             message="No changes detected.",
             qa_pair=db_service.convert_to_api_qa_pair(qa_pair)
-        )
+        ).model_dump(by_alias=True))
 
     # Update the Q&A pair
-    updated_qa = db_service.update_qa_pair(qa_pair, payload.question, payload.answer)
+    updated_qa = db_service.update_qa_pair(qa_pair, question, answer)
+
+    await db_service.commit()
 
     # Broadcast the update
     if manager and manager.is_ready():
@@ -344,13 +378,13 @@ async def update_qa(
             }
         })
 
-    return UpdateQAResponse(
+    return ORJSONResponse(UpdateQAResponse.model_construct(
         message=f'Updated Q/A in cluster "{cluster.title}".',
         qa_pair=db_service.convert_to_api_qa_pair(updated_qa)
-    )
+    ).model_dump(by_alias=True))
 
 
-@router.post("/add_qa", response_model=AddQAResponse, operation_id="add_qa")
+@router.post("/add_qa", responses={200: {"model": AddQAResponse}}, operation_id="add_qa")
 async def add_qa(
     payload: AddQARequest,
     db_service: DatabaseService = Depends(get_database_service)
@@ -363,26 +397,30 @@ async def add_qa(
         raise HTTPException(status_code=400, detail="cluster_list_id must be provided")
 
     # Get cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(payload.cluster_list_id)
+    db_cluster_list = await db_service.get_cluster_list_by_id(payload.cluster_list_id)
     if not db_cluster_list:
         raise HTTPException(status_code=404, detail=f"ClusterList with id '{payload.cluster_list_id}' not found.")
 
-    cluster_name = payload.clusterName.strip()
+    cluster_name = payload.clusterName
     if not cluster_name:
         raise HTTPException(status_code=400, detail="clusterName must be non-empty")
-    if not payload.question.strip():
+    question = payload.question
+    if not question:
         raise HTTPException(status_code=400, detail="question must be non-empty")
-    if not payload.answer.strip():
+    answer = payload.answer
+    if not answer:
         raise HTTPException(status_code=400, detail="answer must be non-empty")
 
     # Get or create cluster
-    cluster = db_service.get_cluster_by_title(payload.cluster_list_id, cluster_name)
+    cluster = await db_service.get_cluster_by_title(payload.cluster_list_id, cluster_name)
     if not cluster:
         # Create new cluster using the UUID string
-        cluster = db_service.create_cluster(payload.cluster_list_id, cluster_name)
+        cluster = await db_service.create_cluster(payload.cluster_list_id, cluster_name)
 
     # Create Q&A pair
-    qa_pair = db_service.create_qa_pair(cluster.id, payload.question, payload.answer)
+    qa_pair = await db_service.create_qa_pair(cluster.id, question, answer)
+
+    await db_service.commit()
 
     # Broadcast the update
     if manager and manager.is_ready():
@@ -394,15 +432,15 @@ async def add_qa(
         })
 
     # Convert cluster to API model
-    api_cluster = db_service.convert_to_api_cluster(cluster)
+    api_cluster = await db_service.convert_to_api_cluster(cluster)
     
-    return AddQAResponse(
+    return ORJSONResponse(AddQAResponse.model_construct(
         message=f'Added Q/A to cluster "{cluster.title}".',
         cluster=api_cluster
-    )
+    ).model_dump(by_alias=True))
 
 
-@router.delete("/qa/{qa_id}", response_model=DeleteQAResponse, operation_id="delete_qa")
+@router.delete("/qa/{qa_id}", responses={200: {"model": DeleteQAResponse}}, operation_id="delete_qa")
 async def delete_qa(
     qa_id: str, 
     clusterName: str, 
@@ -414,28 +452,26 @@ async def delete_qa(
     """
     if not cluster_list_id:
         raise HTTPException(status_code=400, detail="cluster_list_id must be provided")
-
-    # Get cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(cluster_list_id)
-    if not db_cluster_list:
-        raise HTTPException(status_code=404, detail=f"ClusterList with id '{cluster_list_id}' not found.")
-
     cluster_name = clusterName.strip()
     if not cluster_name:
         raise HTTPException(status_code=400, detail="clusterName must be non-empty")
 
-    # Get cluster
-    cluster = db_service.get_cluster_by_title(db_cluster_list.id, cluster_name)
+    # Get cluster (scoped to the list); the list itself is only checked to explain a miss
+    cluster = await db_service.get_cluster_by_title(cluster_list_id, cluster_name)
     if not cluster:
+        if not await db_service.get_cluster_list_by_id(cluster_list_id):
+            raise HTTPException(status_code=404, detail=f"ClusterList with id '{cluster_list_id}' not found.")
         raise HTTPException(status_code=404, detail=f"Cluster '{cluster_name}' not found.")
 
     # Get Q&A pair
-    qa_pair = db_service.get_qa_pair_by_id(qa_id)
+    qa_pair = await db_service.get_qa_pair_by_id(qa_id)
     if not qa_pair or qa_pair.cluster_id != cluster.id:
         raise HTTPException(status_code=404, detail=f"Q/A with id '{qa_id}' not found in cluster '{cluster_name}'.")
 
     # Delete the Q&A pair
-    db_service.delete_qa_pair(qa_pair)
+    await db_service.delete_qa_pair(qa_pair.qa_id)
+
+    await db_service.commit()
 
     # Broadcast the update
     if manager and manager.is_ready():
@@ -446,14 +482,14 @@ async def delete_qa(
             }
         })
 
-    return DeleteQAResponse(
+    return ORJSONResponse(DeleteQAResponse.model_construct(
         message=f'Deleted Q/A from cluster "{cluster.title}".',
         qa_id=qa_id,
         clusterName=cluster.title
-    )
+    ).model_dump(by_alias=True))
 
 
-@router.delete("/cluster-lists/{cluster_list_id}/cluster/{cluster_name}", response_model=DeleteClusterResponse, operation_id="delete_cluster")
+@router.delete("/cluster-lists/{cluster_list_id}/cluster/{cluster_name}", responses={200: {"model": DeleteClusterResponse}}, operation_id="delete_cluster")
 async def delete_cluster(
     cluster_name: str, 
     cluster_list_id: str,
@@ -462,36 +498,32 @@ async def delete_cluster(
     """
     delete_cluster(cluster_name, cluster_list_id) -> deletes a cluster and all its Q/As.
     """
-    print(f"DELETE CLUSTER - cluster_name: {cluster_name}, cluster_list_id: {cluster_list_id}")
+    logger.debug("DELETE CLUSTER - cluster_name: %s, cluster_list_id: %s", cluster_name, cluster_list_id)
     
     if not cluster_list_id:
         raise HTTPException(status_code=400, detail="cluster_list_id must be provided")
-
-    # Get cluster list
-    print(f"Looking up cluster list with ID: {cluster_list_id}")
-    db_cluster_list = db_service.get_cluster_list_by_id(cluster_list_id)
-    print(f"Found cluster list: {db_cluster_list}")
-    if not db_cluster_list:
-        raise HTTPException(status_code=404, detail=f"ClusterList with id '{cluster_list_id}' not found.")
-
     cluster_name_stripped = cluster_name.strip()
     if not cluster_name_stripped:
         raise HTTPException(status_code=400, detail="cluster_name must be non-empty")
 
-    # Get cluster
-    print(f"Looking up cluster with title: '{cluster_name_stripped}' in list ID: {db_cluster_list.list_id}")
-    cluster = db_service.get_cluster_by_title(db_cluster_list.list_id, cluster_name_stripped)
-    print(f"Found cluster: {cluster}")
+    # Get cluster (scoped to the list); the list itself is only checked to explain a miss
+    logger.debug("Looking up cluster with title: '%s' in list ID: %s", cluster_name_stripped, cluster_list_id)
+    cluster = await db_service.get_cluster_by_title(cluster_list_id, cluster_name_stripped)
+    logger.debug("Found cluster: %s", cluster)
     if not cluster:
-        print(f"Cluster not found - Title: '{cluster_name_stripped}', List ID: {db_cluster_list.id}")
+        if not await db_service.get_cluster_list_by_id(cluster_list_id):
+            raise HTTPException(status_code=404, detail=f"ClusterList with id '{cluster_list_id}' not found.")
+        logger.debug("Cluster not found - Title: '%s', List ID: %s", cluster_name_stripped, cluster_list_id)
         raise HTTPException(status_code=404, detail=f"Cluster '{cluster_name_stripped}' not found.")
     
-    print(f"Deleting cluster: ID={cluster.id}, Title='{cluster.title}'")
+    logger.debug("Deleting cluster: ID=%s, Title='%s'", cluster.id, cluster.title)
 
     deleted_cluster_title = cluster.title
     
     # Delete the cluster
-    db_service.delete_cluster(cluster)
+    await db_service.delete_cluster(cluster.id)
+
+    await db_service.commit()
 
     # Broadcast the update
     if manager and manager.is_ready():
@@ -502,15 +534,15 @@ async def delete_cluster(
             }
         })
 
-    return DeleteClusterResponse(
+    return ORJSONResponse(DeleteClusterResponse.model_construct(
         message=f'Deleted cluster "{deleted_cluster_title}".',
         clusterName=deleted_cluster_title
-    )
+    ).model_dump(by_alias=True))
 
 
 @router.delete(
     "/cluster-lists/{cluster_list_id}/qa/{qa_id}",
-    response_model=DeleteQAResponse,
+    responses={200: {"model": DeleteQAResponse}},
     operation_id="delete_qa_from_cluster",
 )
 async def delete_qa_from_cluster(
@@ -518,20 +550,23 @@ async def delete_qa_from_cluster(
     qa_id: str,
     cluster_name: str = Query(..., alias="clusterName"),
     db_service: DatabaseService = Depends(get_database_service),
-    manager: AblyManager = Depends(get_ably_manager),
+    manager: Optional[AblyManager] = Depends(get_ably_manager),
 ):
     """Delete a Q&A pair or source note from a cluster"""
+    cluster_name = cluster_name.strip()
     # Get the cluster
-    cluster = db_service.get_cluster_by_title(cluster_list_id, cluster_name)
+    cluster = await db_service.get_cluster_by_title(cluster_list_id, cluster_name)
     if not cluster:
         raise HTTPException(status_code=404, detail=f"Cluster '{cluster_name}' not found")
 
     # First try to find as a Q&A pair
-    qa_pair = db_service.get_qa_pair_by_id(qa_id)
-    if qa_pair and qa_pair in cluster.qas:
+    qa_pair = await db_service.get_qa_pair_by_id(qa_id)
+    if qa_pair and qa_pair.cluster_id == cluster.id:
         # Delete the Q&A pair
-        db_service.delete_qa_pair(qa_pair)
+        await db_service.delete_qa_pair(qa_pair.qa_id)
         
+        await db_service.commit()
+
         # Broadcast the update
         if manager and manager.is_ready():
             await manager.broadcast({
@@ -541,18 +576,20 @@ async def delete_qa_from_cluster(
                 }
             })
 
-        return DeleteQAResponse(
+        return ORJSONResponse(DeleteQAResponse.model_construct(
             message=f"Q/A pair {qa_id} deleted from cluster {cluster_name}",
             qa_id=qa_id,
             clusterName=cluster_name
-        )
+        ).model_dump(by_alias=True))
     
     # If not found as Q&A pair, try as source note
-    source_note = db_service.get_source_note_by_id(qa_id)
-    if source_note and source_note in cluster.source_notes:
+    source_note = await db_service.get_source_note_by_id(qa_id)
+    if source_note and source_note.cluster_id == cluster.id:
         # Delete the source note
-        db_service.delete_source_note(source_note)
+        await db_service.delete_source_note(source_note)
         
+        await db_service.commit()
+
         # Broadcast the update
         if manager and manager.is_ready():
             await manager.broadcast({
@@ -562,18 +599,18 @@ async def delete_qa_from_cluster(
                 }
             })
 
-        return DeleteQAResponse(
+        return ORJSONResponse(DeleteQAResponse.model_construct(
             message=f"Source note {qa_id} deleted from cluster {cluster_name}",
             qa_id=qa_id,
             clusterName=cluster_name
-        )
+        ).model_dump(by_alias=True))
     
     # If neither found
     raise HTTPException(status_code=404, detail=f"Item with id '{qa_id}' not found in cluster '{cluster_name}'.")
 
 
 # Source Note Routes
-@router.get("/source-notes/{source_note_id}", response_model=SourceNote, operation_id="get_source_note")
+@router.get("/source-notes/{source_note_id}", responses={200: {"model": SourceNote}}, operation_id="get_source_note")
 async def get_source_note(
     source_note_id: str,
     db_service: DatabaseService = Depends(get_database_service)
@@ -581,14 +618,14 @@ async def get_source_note(
     """
     Get a source note by ID.
     """
-    source_note = db_service.get_source_note_by_id(source_note_id)
+    source_note = await db_service.get_source_note_by_id(source_note_id)
     if not source_note:
         raise HTTPException(status_code=404, detail=f"Source note with id '{source_note_id}' not found.")
     
-    return db_service.convert_to_api_source_note(source_note)
+    return ORJSONResponse(db_service.convert_to_api_source_note(source_note).model_dump(by_alias=True))
 
 
-@router.post("/source-notes", response_model=AddSourceNoteResponse, operation_id="create_source_note")
+@router.post("/source-notes", responses={200: {"model": AddSourceNoteResponse}}, operation_id="create_source_note")
 async def create_source_note(
     payload: AddSourceNoteRequest,
     db_service: DatabaseService = Depends(get_database_service)
@@ -600,22 +637,24 @@ async def create_source_note(
         raise HTTPException(status_code=400, detail="cluster_list_id must be provided")
 
     # Get cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(payload.cluster_list_id)
+    db_cluster_list = await db_service.get_cluster_list_by_id(payload.cluster_list_id)
     if not db_cluster_list:
         raise HTTPException(status_code=404, detail=f"ClusterList with id '{payload.cluster_list_id}' not found.")
 
-    cluster_name = payload.cluster_name.strip()
+    cluster_name = payload.cluster_name
     if not cluster_name:
         raise HTTPException(status_code=400, detail="cluster_name must be non-empty")
 
     # Get or create cluster
-    cluster = db_service.get_cluster_by_title(payload.cluster_list_id, cluster_name)
+    cluster = await db_service.get_cluster_by_title(payload.cluster_list_id, cluster_name)
     if not cluster:
         # Create new cluster using the UUID string
-        cluster = db_service.create_cluster(payload.cluster_list_id, cluster_name)
+        cluster = await db_service.create_cluster(payload.cluster_list_id, cluster_name)
 
     # Create source note
-    source_note = db_service.create_source_note(cluster.id, payload.source_metadata, payload.source_content)
+    source_note = await db_service.create_source_note(cluster.id, payload.source_metadata, payload.source_content)
+
+    await db_service.commit()
 
     # Broadcast the update
     if manager and manager.is_ready():
@@ -629,13 +668,13 @@ async def create_source_note(
     # Convert source note to API model
     api_source_note = db_service.convert_to_api_source_note(source_note)
     
-    return AddSourceNoteResponse(
+    return ORJSONResponse(AddSourceNoteResponse.model_construct(
         message=f'Added source note to cluster "{cluster.title}".',
         source_note=api_source_note
-    )
+    ).model_dump(by_alias=True))
 
 
-@router.put("/source-notes/{source_note_id}", response_model=UpdateSourceNoteResponse, operation_id="edit_source_note")
+@router.put("/source-notes/{source_note_id}", responses={200: {"model": UpdateSourceNoteResponse}}, operation_id="edit_source_note")
 async def edit_source_note(
     source_note_id: str,
     payload: UpdateSourceNoteRequest,
@@ -648,11 +687,11 @@ async def edit_source_note(
         raise HTTPException(status_code=400, detail="cluster_list_id must be provided")
 
     # Get cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(payload.cluster_list_id)
+    db_cluster_list = await db_service.get_cluster_list_by_id(payload.cluster_list_id)
     if not db_cluster_list:
         raise HTTPException(status_code=404, detail=f"ClusterList with id '{payload.cluster_list_id}' not found.")
 
-    cluster_name = payload.cluster_name.strip()
+    cluster_name = payload.cluster_name
     if not cluster_name:
         raise HTTPException(status_code=400, detail="cluster_name must be non-empty")
     if not source_note_id:
@@ -661,18 +700,20 @@ async def edit_source_note(
         raise HTTPException(status_code=400, detail="At least one of 'source_metadata' or 'source_content' must be provided for an update.")
 
     # Get cluster
-    cluster = db_service.get_cluster_by_title(db_cluster_list.id, cluster_name)
+    cluster = await db_service.get_cluster_by_title(db_cluster_list.list_id, cluster_name)
     if not cluster:
         raise HTTPException(status_code=404, detail=f"Cluster '{cluster_name}' not found in list '{payload.cluster_list_id}'.")
 
     # Get source note
-    source_note = db_service.get_source_note_by_id(source_note_id)
+    source_note = await db_service.get_source_note_by_id(source_note_id)
     if not source_note or source_note.cluster_id != cluster.id:
         raise HTTPException(status_code=404, detail=f"Source note with id '{source_note_id}' not found in cluster '{cluster_name}'.")
 
     # Update the source note
     updated_source_note = db_service.update_source_note(source_note, payload.source_metadata, payload.source_content)
 
+    await db_service.commit()
+
     # Broadcast the update
     if manager and manager.is_ready():
         await manager.broadcast({
@@ -682,13 +723,13 @@ async def edit_source_note(
             }
         })
 
-    return UpdateSourceNoteResponse(
+    return ORJSONResponse(UpdateSourceNoteResponse.model_construct(
         message=f'Updated source note in cluster "{cluster.title}".',
         source_note=db_service.convert_to_api_source_note(updated_source_note)
-    )
+    ).model_dump(by_alias=True))
 
 
-@router.delete("/source-notes/{source_note_id}", response_model=DeleteSourceNoteResponse, operation_id="remove_source_note")
+@router.delete("/source-notes/{source_note_id}", responses={200: {"model": DeleteSourceNoteResponse}}, operation_id="remove_source_note")
 async def remove_source_note(
     source_note_id: str,
     cluster_name: str,
@@ -702,7 +743,7 @@ async def remove_source_note(
         raise HTTPException(status_code=400, detail="cluster_list_id must be provided")
 
     # Get cluster list
-    db_cluster_list = db_service.get_cluster_list_by_id(cluster_list_id)
+    db_cluster_list = await db_service.get_cluster_list_by_id(cluster_list_id)
     if not db_cluster_list:
         raise HTTPException(status_code=404, detail=f"ClusterList with id '{cluster_list_id}' not found.")
 
@@ -711,17 +752,19 @@ async def remove_source_note(
         raise HTTPException(status_code=400, detail="cluster_name must be non-empty")
 
     # Get cluster
-    cluster = db_service.get_cluster_by_title(db_cluster_list.id, cluster_name_stripped)
+    cluster = await db_service.get_cluster_by_title(db_cluster_list.list_id, cluster_name_stripped)
     if not cluster:
         raise HTTPException(status_code=404, detail=f"Cluster '{cluster_name_stripped}' not found.")
 
     # Get source note
-    source_note = db_service.get_source_note_by_id(source_note_id)
+    source_note = await db_service.get_source_note_by_id(source_note_id)
     if not source_note or source_note.cluster_id != cluster.id:
         raise HTTPException(status_code=404, detail=f"Source note with id '{source_note_id}' not found in cluster '{cluster_name_stripped}'.")
 
     # Delete the source note
-    db_service.delete_source_note(source_note)
+    await db_service.delete_source_note(source_note)
+
+    await db_service.commit()
 
     # Broadcast the update
     if manager and manager.is_ready():
@@ -732,10 +775,10 @@ async def remove_source_note(
             }
         })
 
-    return DeleteSourceNoteResponse(
+    return ORJSONResponse(DeleteSourceNoteResponse.model_construct(
         message=f'Deleted source note from cluster "{cluster.title}".',
         source_note_id=source_note_id,
         cluster_name=cluster.title
-    )
+    ).model_dump(by_alias=True))
 
 
@@ -1,6 +1,36 @@
 import os
 import asyncio
+import functools
+import logging
+import orjson
+from pydantic import BaseModel
 from ably import AblyRealtime, AblyRest
+from ably.types.message import Message
+
+logger = logging.getLogger(__name__)
+
+
+# Broadcasts are queued and published together once per window, so a burst of
+# writes costs one Ably request instead of one per mutation
+BROADCAST_BATCH_WINDOW_SECONDS = 0.05
+BROADCAST_MAX_BATCH_SIZE = 100
+# Upper bound on unpublished broadcasts; beyond it new ones are dropped rather than buffered
+BROADCAST_QUEUE_MAXSIZE = 10000
+
+
+def _default(obj):
+    """Encode values orjson has no native support for (models, Decimal, ...)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    return str(obj)
+
+
+# Broadcast serializer with its options bound once; naive datetimes are stored as UTC
+_dumps = functools.partial(
+    orjson.dumps,
+    default=_default,
+    option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+)
 
 
 class AblyManager:
@@ -9,52 +39,90 @@ class AblyManager:
         self.ably_rest = AblyRest(self.ably_api_key) if self.ably_api_key else None
         self.ably_realtime = None
         self.channel = None
-        self._connection_event = None
+        self._broadcast_queue: asyncio.Queue = asyncio.Queue(maxsize=BROADCAST_QUEUE_MAXSIZE)
+        self._broadcast_task = None
 
     async def initialize_realtime(self):
         """Initialize Ably Realtime connection."""
         if not self.ably_api_key:
-            print("ABLY_API_KEY not found, cannot initialize Ably Realtime.")
+            logger.warning("ABLY_API_KEY not found, cannot initialize Ably Realtime.")
             return
 
         try:
             self.ably_realtime = AblyRealtime(self.ably_api_key, client_id="thinkex-backend-server")
-            print("Ably Realtime client created.")
+            logger.debug("Ably Realtime client created.")
 
             def on_state_change(state_change):
                 if state_change.current == "connected":
-                    print("Ably Realtime connected!")
+                    logger.info("Ably Realtime connected!")
                 elif state_change.current == "failed":
-                    print(f"Ably Realtime connection failed: {state_change.reason}")
+                    logger.error("Ably Realtime connection failed: %s", state_change.reason)
                 else:
-                    print(f"Ably Realtime connection state: {state_change.current}")
+                    logger.info("Ably Realtime connection state: %s", state_change.current)
 
             self.ably_realtime.connection.on(on_state_change)
             await self.ably_realtime.connection.once_async("connected")
             
             self.channel = self.ably_realtime.channels.get('knowledge-graph-updates')
-            print("Ably channel ready for broadcasting")
+            self._broadcast_task = asyncio.create_task(self._publish_batches())
+            logger.info("Ably channel ready for broadcasting")
 
         except Exception as e:
-            print(f"Failed to initialize Ably Realtime client: {e}")
+            logger.exception("Failed to initialize Ably Realtime client: %s", e)
 
     def is_ready(self):
         return self.channel is not None
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients via Ably"""
+        """Queue a message for the next batched broadcast to all connected clients"""
         if not self.is_ready():
-            print("Ably channel not available, skipping broadcast")
+            logger.debug("Ably channel not available, skipping broadcast")
             return
         
+        # Queue the serialized bytes so the payload dict is freed as soon as the route returns
+        try:
+            self._broadcast_queue.put_nowait(_dumps(message))
+        except asyncio.QueueFull:
+            logger.warning("Broadcast queue full, dropping message")
+
+    async def _publish_batches(self):
+        """Drain the broadcast queue, publishing everything queued within a window at once"""
+        while True:
+            batch = [await self._broadcast_queue.get()]
+            try:
+                await asyncio.sleep(BROADCAST_BATCH_WINDOW_SECONDS)
+            finally:
+                # Still publish the batch in hand if cancelled during the window
+                while not self._broadcast_queue.empty() and len(batch) < BROADCAST_MAX_BATCH_SIZE:
+                    batch.append(self._broadcast_queue.get_nowait())
+                await self._publish(batch)
+
+    async def _publish(self, batch: list):
+        """Publish queued payloads in a single Ably request"""
+        # Clients refetch on every message, so identical updates in one batch collapse into one
+        payloads = list(dict.fromkeys(batch))
         try:
-            await self.channel.publish('server-update', message)
-            print(f"Message broadcasted via Ably: {message.get('type', 'unknown')}")
+            # Serialized once with orjson; the 'json' encoding tells subscribers to
+            # decode it, exactly as if the SDK had json.dumps'd the dict itself
+            await self.channel.publish([
+                Message(name='server-update', data=payload.decode(), encoding='json')
+                for payload in payloads
+            ])
+            logger.debug("Broadcasted %d message(s) via Ably", len(payloads))
         except Exception as e:
-            print(f"Failed to broadcast message via Ably: {e}")
+            logger.error("Failed to broadcast message via Ably: %s", e)
 
     async def close(self):
-        """Close the Ably connection"""
+        """Flush pending broadcasts and close the Ably connection"""
+        if self._broadcast_task:
+            self._broadcast_task.cancel()
+            await asyncio.gather(self._broadcast_task, return_exceptions=True)
+            self._broadcast_task = None
+        pending = []
+        while not self._broadcast_queue.empty():
+            pending.append(self._broadcast_queue.get_nowait())
+        if pending and self.is_ready():
+            await self._publish(pending)
         if self.ably_realtime:
             await self.ably_realtime.close()
-            print("Ably connection closed")
+            logger.info("Ably connection closed")
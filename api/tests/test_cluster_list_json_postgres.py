@@ -0,0 +1,173 @@
+"""Cluster list documents built by Postgres, checked against a real database
+
+Set TEST_DATABASE_URL to a disposable Postgres database to run these tests;
+tables are created in it if missing.
+"""
+import asyncio
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("TEST_DATABASE_URL not set", allow_module_level=True)
+
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ["AUTOCREATE_TABLES"] = "1"
+os.environ.pop("ABLY_API_KEY", None)
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, update
+from sqlmodel import select
+
+import main
+from database import DatabaseService
+from database import service as database_service
+from database.connection import async_session
+from models.database_models import ClusterDB, ClusterListDB, QAPairDB
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def cluster_list_id(client):
+    list_id = client.post("/cluster-lists", json={"title": "Postgres JSON"}).json()["id"]
+    for question in ("first", "second", "third"):
+        response = client.post("/add_qa", json={
+            "cluster_list_id": list_id, "clusterName": "Math", "question": question, "answer": "a"
+        })
+        assert response.status_code == 200
+    response = client.post("/source-notes", json={
+        "cluster_list_id": list_id,
+        "cluster_name": "Math",
+        "source_metadata": {"title": "Book", "source_type": "book"},
+        "source_content": {"summary": "Summary", "tags": ["t"]},
+    })
+    assert response.status_code == 200
+    yield list_id
+    client.delete(f"/cluster-lists/{list_id}")
+
+
+def orm_document(client, list_id):
+    """The same cluster list converted through the ORM and Pydantic models"""
+    async def load():
+        async with async_session() as session:
+            service = DatabaseService(session)
+            cluster_list = await service.get_cluster_list_by_id(list_id, eager=True)
+            return service.convert_to_api_cluster_list(cluster_list).model_dump(mode="json", by_alias=True)
+    return client.portal.call(load)
+
+
+def test_get_cluster_list_by_id_matches_orm_conversion(client, cluster_list_id):
+    response = client.get(f"/cluster-lists/{cluster_list_id}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    document = response.json()
+    assert [qa["question"] for qa in document["clusters"][0]["qas"]] == ["first", "second", "third", "Book"]
+    assert document == orm_document(client, cluster_list_id)
+
+
+def test_get_clusters_returns_a_document(client, cluster_list_id):
+    response = client.get("/clusters")
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"id", "title", "clusters"}
+
+
+def test_unchanged_document_revalidates_with_304(client, cluster_list_id):
+    etag = client.get(f"/cluster-lists/{cluster_list_id}").headers["etag"]
+
+    response = client.get(f"/cluster-lists/{cluster_list_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+def test_info_read_overlapping_a_commit_is_not_cached(client):
+    async def read_while_committing():
+        async with async_session() as session:
+            service = DatabaseService(session)
+            exec_ = session.exec
+
+            async def exec_then_commit_elsewhere(*args, **kwargs):
+                result = await exec_(*args, **kwargs)
+                database_service.invalidate_cluster_list_info_cache()
+                return result
+
+            session.exec = exec_then_commit_elsewhere
+            database_service.invalidate_cluster_list_info_cache()
+            return await service.get_cluster_list_info()
+
+    client.portal.call(read_while_committing)
+    assert database_service._cluster_list_info_cache is None
+
+
+def test_cluster_list_info_follows_committed_creates_and_deletes(client):
+    client.get("/cluster-lists/info")
+    list_id = client.post("/cluster-lists", json={"title": "Info"}).json()["id"]
+
+    assert list_id in [info["id"] for info in client.get("/cluster-lists/info").json()]
+
+    client.delete(f"/cluster-lists/{list_id}")
+
+    assert list_id not in [info["id"] for info in client.get("/cluster-lists/info").json()]
+
+
+def test_concurrent_appends_get_distinct_orders(client, cluster_list_id):
+    async def append(cluster_id, question):
+        async with async_session() as session:
+            service = DatabaseService(session)
+            await service.create_qa_pair(cluster_id, question, "a")
+            await service.commit()
+
+    async def append_concurrently():
+        async with async_session() as session:
+            cluster = await DatabaseService(session).get_cluster_by_title(cluster_list_id, "math")
+        await asyncio.gather(*(append(cluster.id, f"concurrent {i}") for i in range(8)))
+        async with async_session() as session:
+            result = await session.exec(select(QAPairDB.order).where(QAPairDB.cluster_id == cluster.id))
+            return list(result.all())
+
+    orders = client.portal.call(append_concurrently)
+
+    assert sorted(orders) == list(range(len(orders)))
+
+
+def test_moved_qa_goes_to_the_end_of_the_destination_cluster(client, cluster_list_id):
+    for question in ("p0", "p1", "p2", "p3"):
+        client.post("/add_qa", json={
+            "cluster_list_id": cluster_list_id, "clusterName": "Physics", "question": question, "answer": "a"
+        })
+    math = client.get(f"/cluster-lists/{cluster_list_id}").json()["clusters"][0]
+    second = next(qa["_id"] for qa in math["qas"] if qa["question"] == "second")
+
+    response = client.patch(
+        f"/cluster-lists/{cluster_list_id}/qa/{second}/move", json={"new_cluster_title": "Physics"}
+    )
+
+    assert response.status_code == 200
+    clusters = {c["title"]: c for c in client.get(f"/cluster-lists/{cluster_list_id}").json()["clusters"]}
+    assert [qa["question"] for qa in clusters["Physics"]["qas"]] == ["p0", "p1", "p2", "p3", "second"]
+    assert [qa["question"] for qa in clusters["Math"]["qas"]] == ["first", "third", "Book"]
+
+
+def test_whole_second_timestamps_match_orm_conversion(client, cluster_list_id):
+    async def truncate_created_at():
+        async with async_session() as session:
+            clusters = select(ClusterDB.id).join(ClusterListDB).where(ClusterListDB.list_id == cluster_list_id)
+            await session.exec(
+                update(QAPairDB)
+                .where(QAPairDB.cluster_id.in_(clusters))
+                .values(created_at=func.date_trunc("second", QAPairDB.created_at))
+            )
+            await session.commit()
+    client.portal.call(truncate_created_at)
+
+    document = client.get(f"/cluster-lists/{cluster_list_id}").json()
+
+    assert document["clusters"][0]["qas"][0]["created_at"].endswith(".000000Z")
+    assert document == orm_document(client, cluster_list_id)